@@ -5,6 +5,7 @@ import json
 import logging
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any, Protocol
 
 from reddit_watcher.a2a_protocol import (
@@ -158,12 +159,12 @@ class BaseA2AAgent(ABC):
         pass
 
     @abstractmethod
-    def get_skills(self) -> list[AgentSkill]:
+    def get_skills(self) -> Sequence[AgentSkill]:
         """
         Define the specific skills this agent provides.
 
         Returns:
-            List of AgentSkill objects describing agent capabilities
+            Sequence of AgentSkill objects describing agent capabilities
         """
         pass
 
@@ -234,7 +235,7 @@ class BaseA2AAgent(ABC):
             defaultInputModes=["text/plain", "application/json"],
             defaultOutputModes=["application/json"],
             capabilities=capabilities,
-            skills=self.get_skills(),
+            skills=list(self.get_skills()),
             securitySchemes=security_schemes if security_schemes else None,
         )
 
@@ -341,8 +341,8 @@ class A2AAgentServer:
                     status_code=500, detail="Failed to generate agent card"
                 ) from e
 
-        # Health check endpoint
-        @app.get("/health")
+        # Health check endpoint; HEAD lets header-only probes skip the body
+        @app.api_route("/health", methods=["GET", "HEAD"])
         async def health_check():
             """Health check endpoint for service monitoring."""
             try:
@@ -2,14 +2,20 @@
 # ABOUTME: Implements A2A skills for generating concise summaries with primary/fallback strategy and extractive backup
 
 import asyncio
+import hashlib
 import logging
 import re
 import time
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import cached_property
+from itertools import chain
 from typing import Any
 
 import google.generativeai as genai
+import numpy as np
 import spacy
 from google.api_core import exceptions as google_exceptions
 
@@ -20,14 +26,82 @@ from reddit_watcher.performance.ml_model_cache import get_model_cache
 
 logger = logging.getLogger(__name__)
 
+# Separators used for recursive chunking, from coarsest to finest boundary
+CHUNK_SEPARATORS = ("\n\n", "\n", ". ", " ")
 
-@dataclass
+# Maximum number of Gemini responses kept in the prompt cache
+PROMPT_CACHE_SIZE = 512
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+_WORD_TOKEN = re.compile(r"\w+")
+
+
+def _iter_pieces(content: str, separator: str) -> Iterator[str]:
+    """Yield the pieces of content split on separator, keeping the separator."""
+    parts = content.split(separator)
+    for part in parts[:-1]:
+        yield part + separator
+    if parts[-1]:
+        yield parts[-1]
+
+
+def _prompt_cache_key(model_name: str, content: str) -> str:
+    """Build the prompt cache key for a model and content pair."""
+    return hashlib.blake2b(
+        f"{model_name}\0{content}".encode(), digest_size=16
+    ).hexdigest()
+
+
+def _top_sentence_indices(sentences: list[str], count: int) -> np.ndarray:
+    """
+    Select the highest scoring sentences for an extractive summary.
+
+    Each sentence is scored by the mean corpus term frequency of its tokens,
+    i.e. how often each of its words occurs across all sentences.
+    Scoring is vectorized over a flat (sentence, token) layout so large
+    inputs avoid a per-sentence Python loop.
+
+    Args:
+        sentences: Sentences to rank
+        count: Number of sentences to select
+
+    Returns:
+        Indices of the selected sentences in document order
+    """
+    tokenized = [_WORD_TOKEN.findall(sentence.lower()) for sentence in sentences]
+    frequencies = Counter(chain.from_iterable(tokenized))
+    vocabulary = {token: index for index, token in enumerate(frequencies)}
+
+    token_ids = np.fromiter(
+        (vocabulary[token] for tokens in tokenized for token in tokens),
+        dtype=np.intp,
+    )
+    sentence_ids = np.repeat(
+        np.arange(len(tokenized)), [len(tokens) for tokens in tokenized]
+    )
+    token_weights = np.fromiter(frequencies.values(), dtype=np.float64)
+
+    totals = np.bincount(
+        sentence_ids, weights=token_weights[token_ids], minlength=len(sentences)
+    )
+    lengths = np.bincount(sentence_ids, minlength=len(sentences))
+    scores = totals / np.maximum(lengths, 1)
+
+    selected = np.argpartition(scores, -count)[-count:]
+    selected.sort()
+    return selected
+
+
+@dataclass(slots=True)
 class RateLimitState:
     """Track rate limiting state for API calls."""
 
     requests_made: int = 0
     window_start: float = 0.0
     max_requests_per_minute: int = 100
+    time_fn: Callable[[], float] = field(
+        default=time.monotonic, repr=False, compare=False
+    )
 
 
 class SummariseAgent(BaseA2AAgent):
@@ -56,6 +130,11 @@ class SummariseAgent(BaseA2AAgent):
         self._rate_limit_state = RateLimitState(
             max_requests_per_minute=self.config.gemini_rate_limit
         )
+        self._rate_limit_lock = asyncio.Lock()
+        # The shared spaCy pipeline is not thread-safe; one fallback at a time
+        self._extractive_lock = asyncio.Lock()
+        # LRU cache of Gemini summaries keyed by model and content digest
+        self._prompt_cache: OrderedDict[str, str] = OrderedDict()
 
         # Use optimized ML model cache
         self._model_cache = get_model_cache()
@@ -80,7 +159,7 @@ class SummariseAgent(BaseA2AAgent):
             self._gemini_initialized = False
 
     async def _ensure_spacy_model(self) -> spacy.language.Language:
-        """Ensure spaCy model is loaded with optimization."""
+        """Load the spaCy model on first use of the extractive fallback."""
         if self._nlp_model is None:
             self._nlp_model = await self._model_cache.get_spacy_model(
                 model_name="en_core_web_sm", fallback_to_blank=True
@@ -89,35 +168,42 @@ class SummariseAgent(BaseA2AAgent):
 
     async def _check_rate_limit(self) -> None:
         """Check and enforce rate limiting for Gemini API calls."""
-        current_time = time.time()
+        state = self._rate_limit_state
+        current_time = state.time_fn()
 
         # Reset window if a minute has passed
-        if current_time - self._rate_limit_state.window_start >= 60:
-            self._rate_limit_state.requests_made = 0
-            self._rate_limit_state.window_start = current_time
+        if current_time - state.window_start >= 60:
+            state.requests_made = 0
+            state.window_start = current_time
 
         # If we've hit the limit, wait until the window resets
-        if (
-            self._rate_limit_state.requests_made
-            >= self._rate_limit_state.max_requests_per_minute
-        ):
-            wait_time = 60 - (current_time - self._rate_limit_state.window_start)
+        if state.requests_made >= state.max_requests_per_minute:
+            wait_time = 60 - (current_time - state.window_start)
             if wait_time > 0:
                 self.logger.info(f"Rate limit reached, waiting {wait_time:.1f} seconds")
                 await asyncio.sleep(wait_time)
                 # Reset after waiting
-                self._rate_limit_state.requests_made = 0
-                self._rate_limit_state.window_start = time.time()
+                state.requests_made = 0
+                state.window_start = state.time_fn()
 
     def _split_content_recursively(
-        self, content: str, max_chunk_size: int = 8000
+        self,
+        content: str,
+        max_chunk_size: int = 8000,
+        separators: tuple[str, ...] = CHUNK_SEPARATORS,
     ) -> list[str]:
         """
         Split content into chunks that fit within token limits.
 
+        Separators are tried from coarsest to finest (paragraphs, lines,
+        sentences, words); a finer separator is only used for pieces that are
+        still too large. Separators stay attached to their pieces so that
+        joining the chunks reproduces the original content.
+
         Args:
             content: Text content to split
             max_chunk_size: Maximum characters per chunk (approximate token limit)
+            separators: Remaining separators to try, in priority order
 
         Returns:
             List of content chunks
@@ -125,58 +211,60 @@ class SummariseAgent(BaseA2AAgent):
         if len(content) <= max_chunk_size:
             return [content]
 
-        chunks = []
+        if not separators:
+            # No natural boundary left, force split at the size limit
+            return [
+                content[i : i + max_chunk_size]
+                for i in range(0, len(content), max_chunk_size)
+            ]
 
-        # Try to split by paragraphs first
-        paragraphs = content.split("\n\n")
-        current_chunk = ""
+        separator, finer_separators = separators[0], separators[1:]
+        if separator not in content:
+            return self._split_content_recursively(
+                content, max_chunk_size, finer_separators
+            )
 
-        for paragraph in paragraphs:
-            # If single paragraph is too large, split by sentences
-            if len(paragraph) > max_chunk_size:
-                if self._nlp_model:
-                    doc = self._nlp_model(paragraph)
-                    sentences = [sent.text for sent in doc.sents]
-                else:
-                    # Basic sentence splitting if spaCy not available
-                    sentences = re.split(r"[.!?]+", paragraph)
-
-                for sentence in sentences:
-                    if len(current_chunk + sentence) > max_chunk_size:
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                            current_chunk = sentence
-                        else:
-                            # Even single sentence is too large, force split
-                            chunks.append(sentence[:max_chunk_size])
-                            current_chunk = sentence[max_chunk_size:]
-                    else:
-                        current_chunk += sentence
-            else:
-                # Normal paragraph processing
-                if len(current_chunk + paragraph) > max_chunk_size:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                        current_chunk = paragraph
-                    else:
-                        chunks.append(paragraph)
-                else:
-                    current_chunk += "\n\n" + paragraph if current_chunk else paragraph
+        chunks: list[str] = []
+        current_pieces: list[str] = []
+        current_length = 0
+
+        for piece in _iter_pieces(content, separator):
+            if len(piece) > max_chunk_size:
+                if current_pieces:
+                    chunks.append("".join(current_pieces))
+                    current_pieces, current_length = [], 0
+                chunks.extend(
+                    self._split_content_recursively(
+                        piece, max_chunk_size, finer_separators
+                    )
+                )
+                continue
+
+            if current_length + len(piece) > max_chunk_size:
+                chunks.append("".join(current_pieces))
+                current_pieces, current_length = [], 0
 
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+            current_pieces.append(piece)
+            current_length += len(piece)
+
+        if current_pieces:
+            chunks.append("".join(current_pieces))
 
         return chunks
 
     async def _summarize_with_gemini(
-        self, content: str, use_fallback_model: bool = False
+        self, content: str, use_fallback_model: bool = False, use_cache: bool = True
     ) -> str | None:
         """
         Summarize content using Gemini models with retry logic.
 
+        Identical prompts are served from an in-memory LRU cache so repeated
+        content does not consume API quota.
+
         Args:
             content: Content to summarize
             use_fallback_model: Whether to use fallback model instead of primary
+            use_cache: Whether to read cached summaries before calling the API
 
         Returns:
             Generated summary or None if failed
@@ -190,9 +278,17 @@ class SummariseAgent(BaseA2AAgent):
             else self.config.gemini_model_primary
         )
 
+        cache_key = _prompt_cache_key(model_name, content)
+        if use_cache and cache_key in self._prompt_cache:
+            self._prompt_cache.move_to_end(cache_key)
+            self.logger.debug(f"Prompt cache hit for {model_name}")
+            return self._prompt_cache[cache_key]
+
         try:
-            await self._check_rate_limit()
-            self._rate_limit_state.requests_made += 1
+            # Serialize quota accounting so concurrent chunks share one window
+            async with self._rate_limit_lock:
+                await self._check_rate_limit()
+                self._rate_limit_state.requests_made += 1
 
             model = genai.GenerativeModel(model_name)
 
@@ -207,11 +303,18 @@ Content:
 
 Summary:"""
 
-            response = model.generate_content(prompt)
+            # The SDK call blocks, so run it off the event loop to let
+            # concurrent chunk requests overlap
+            response = await asyncio.to_thread(model.generate_content, prompt)
 
             if response.text:
                 self.logger.debug(f"Generated summary using {model_name}")
-                return response.text.strip()
+                summary = response.text.strip()
+                self._prompt_cache[cache_key] = summary
+                self._prompt_cache.move_to_end(cache_key)
+                if len(self._prompt_cache) > PROMPT_CACHE_SIZE:
+                    self._prompt_cache.popitem(last=False)
+                return summary
             else:
                 self.logger.warning(f"Empty response from {model_name}")
                 return None
@@ -228,9 +331,18 @@ Summary:"""
             self.logger.error(f"Unexpected error with {model_name}: {e}")
             return None
 
+    def _split_sentences(self, content: str) -> list[str]:
+        """Split content into sentences, using spaCy when it is loaded."""
+        if self._nlp_model:
+            doc = self._nlp_model(content)
+            sentences = (sent.text.strip() for sent in doc.sents)
+        else:
+            sentences = (s.strip() for s in _SENTENCE_BOUNDARY.split(content))
+        return [s for s in sentences if s]
+
     def _extractive_summarization(self, content: str, max_sentences: int = 3) -> str:
         """
-        Fallback extractive summarization using simple heuristics.
+        Fallback extractive summarization using word-frequency scoring.
 
         Args:
             content: Content to summarize
@@ -239,73 +351,109 @@ Summary:"""
         Returns:
             Extractive summary
         """
-        if not self._nlp_model:
-            # Very basic fallback - return first few sentences
-            sentences = re.split(r"[.!?]+", content)
-            summary_sentences = [
-                s.strip() for s in sentences[:max_sentences] if s.strip()
-            ]
-            return ". ".join(summary_sentences) + "."
-
         try:
-            doc = self._nlp_model(content)
-            sentences = list(doc.sents)
+            sentences = self._split_sentences(content)
 
             if len(sentences) <= max_sentences:
                 return content
 
-            # Simple extractive method: take first, middle, and last sentences
-            if max_sentences == 3 and len(sentences) >= 3:
-                selected = [sentences[0], sentences[len(sentences) // 2], sentences[-1]]
-            else:
-                # Distribute sentences evenly
-                step = len(sentences) // max_sentences
-                selected = [sentences[i * step] for i in range(max_sentences)]
-
-            summary = " ".join([sent.text.strip() for sent in selected])
-            return summary
+            selected = _top_sentence_indices(sentences, max_sentences)
+            return " ".join(sentences[i] for i in selected)
 
         except Exception as e:
             self.logger.error(f"Extractive summarization failed: {e}")
             # Ultimate fallback
             return content[:500] + "..." if len(content) > 500 else content
 
+    async def _extractive_summary_in_thread(
+        self, content: str, max_sentences: int = 3
+    ) -> str:
+        """
+        Run the extractive fallback in a worker thread, one call at a time.
+
+        The spaCy parse is CPU-bound, so it runs off the event loop; the lock
+        keeps concurrent chunks from sharing the pipeline across threads.
+
+        Args:
+            content: Content to summarize
+            max_sentences: Maximum number of sentences in summary
+
+        Returns:
+            Extractive summary
+        """
+        await self._ensure_spacy_model()
+        async with self._extractive_lock:
+            return await asyncio.to_thread(
+                self._extractive_summarization, content, max_sentences
+            )
+
+    async def _summarize_chunk(self, index: int, total: int, chunk: str) -> str:
+        """
+        Summarize a single content chunk with model and extractive fallbacks.
+
+        Args:
+            index: Zero-based position of the chunk
+            total: Total number of chunks being processed
+            chunk: Content chunk to summarize
+
+        Returns:
+            Chunk summary
+        """
+        self.logger.debug(f"Processing chunk {index + 1}/{total}")
+
+        # Try primary model first
+        summary = await self._summarize_with_gemini(chunk, use_fallback_model=False)
+
+        # Try fallback model if primary failed
+        if not summary:
+            self.logger.info(
+                f"Primary model failed for chunk {index + 1}, trying fallback"
+            )
+            summary = await self._summarize_with_gemini(chunk, use_fallback_model=True)
+
+        # Use extractive fallback if both AI models failed
+        if not summary:
+            self.logger.info(
+                f"AI models failed for chunk {index + 1}, using extractive fallback"
+            )
+            summary = await self._extractive_summary_in_thread(chunk)
+
+        return summary
+
     async def _summarize_content_chunks(self, chunks: list[str]) -> str:
         """
         Summarize multiple content chunks and combine results.
 
+        Chunks are summarized concurrently, at most one rate limit window's
+        worth at a time, and summaries keep the original chunk order. If one
+        chunk fails the remaining chunks are cancelled and its error is raised.
+
         Args:
             chunks: List of content chunks to summarize
 
         Returns:
             Combined summary
         """
-        chunk_summaries = []
-
-        for i, chunk in enumerate(chunks):
-            self.logger.debug(f"Processing chunk {i + 1}/{len(chunks)}")
+        # The rate limiter only delays requests, so bound the number of chunk
+        # tasks in flight instead of queueing every chunk behind it
+        in_flight = asyncio.Semaphore(self._rate_limit_state.max_requests_per_minute)
 
-            # Try primary model first
-            summary = await self._summarize_with_gemini(chunk, use_fallback_model=False)
+        async def summarize_bounded(index: int, chunk: str) -> str:
+            async with in_flight:
+                return await self._summarize_chunk(index, len(chunks), chunk)
 
-            # Try fallback model if primary failed
-            if not summary:
-                self.logger.info(
-                    f"Primary model failed for chunk {i + 1}, trying fallback"
-                )
-                summary = await self._summarize_with_gemini(
-                    chunk, use_fallback_model=True
-                )
-
-            # Use extractive fallback if both AI models failed
-            if not summary:
-                self.logger.info(
-                    f"AI models failed for chunk {i + 1}, using extractive fallback"
-                )
-                summary = self._extractive_summarization(chunk)
-
-            if summary:
-                chunk_summaries.append(summary)
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(summarize_bounded(i, chunk))
+                    for i, chunk in enumerate(chunks)
+                ]
+        except ExceptionGroup as errors:
+            # Surface the failing chunk's own error rather than the group
+            raise errors.exceptions[0] from errors
+
+        summaries = (task.result() for task in tasks)
+        chunk_summaries = [summary for summary in summaries if summary]
 
         if not chunk_summaries:
             return "Summary generation failed for all content chunks."
@@ -327,13 +475,16 @@ Summary:"""
                 return final_summary
             else:
                 # Fallback to extractive combination
-                return self._extractive_summarization(combined_content, max_sentences=5)
+                return await self._extractive_summary_in_thread(
+                    combined_content, max_sentences=5
+                )
 
         return chunk_summaries[0]
 
-    def get_skills(self) -> list[AgentSkill]:
-        """Define the skills provided by the SummariseAgent."""
-        return [
+    @cached_property
+    def skills(self) -> tuple[AgentSkill, ...]:
+        """Skills provided by the SummariseAgent, built once per agent."""
+        return (
             AgentSkill(
                 id="health_check",
                 name="health_check",
@@ -352,7 +503,11 @@ Summary:"""
                 outputModes=["application/json"],
                 examples=[],
             ),
-        ]
+        )
+
+    def get_skills(self) -> tuple[AgentSkill, ...]:
+        """Define the skills provided by the SummariseAgent."""
+        return self.skills
 
     async def execute_skill(
         self, skill_name: str, parameters: dict[str, Any]
@@ -433,16 +588,16 @@ Summary:"""
 
     async def get_agent_specific_health(self) -> dict[str, Any]:
         """Get summarise-specific health information."""
+        rate_limit_state = self._rate_limit_state
+        window_elapsed = rate_limit_state.time_fn() - rate_limit_state.window_start
         summarise_health = {
             "gemini_initialized": self._gemini_initialized,
             "spacy_available": self._nlp_model is not None,
-            "rate_limit_requests_made": self._rate_limit_state.requests_made,
-            "rate_limit_window_remaining": max(
-                0, 60 - (time.time() - self._rate_limit_state.window_start)
-            ),
+            "rate_limit_requests_made": rate_limit_state.requests_made,
+            "rate_limit_window_remaining": max(0, 60 - window_elapsed),
             "primary_model": self.config.gemini_model_primary,
             "fallback_model": self.config.gemini_model_fallback,
-            "max_requests_per_minute": self._rate_limit_state.max_requests_per_minute,
+            "max_requests_per_minute": rate_limit_state.max_requests_per_minute,
         }
 
         # Check Gemini API connectivity
@@ -452,7 +607,9 @@ Summary:"""
             try:
                 # Test Gemini connectivity with a simple request
                 test_summary = await self._summarize_with_gemini(
-                    "Test content for health check", use_fallback_model=False
+                    "Test content for health check",
+                    use_fallback_model=False,
+                    use_cache=False,
                 )
                 if test_summary:
                     gemini_connectivity["status"] = "connected"
@@ -460,7 +617,9 @@ Summary:"""
                 else:
                     # Try fallback model
                     test_summary_fallback = await self._summarize_with_gemini(
-                        "Test content for health check", use_fallback_model=True
+                        "Test content for health check",
+                        use_fallback_model=True,
+                        use_cache=False,
                     )
                     if test_summary_fallback:
                         gemini_connectivity["status"] = "connected"
@@ -3,24 +3,51 @@
 
 import ipaddress
 import logging
+import math
 import time
-from collections import defaultdict, deque
+from dataclasses import dataclass
 
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from reddit_watcher.config import Settings
 
 logger = logging.getLogger(__name__)
 
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class GCRALimit:
+    """A GCRA rate limit with its period and emission interval in nanoseconds."""
+
+    limit_type: str
+    period_ns: int
+    increment_ns: int
+    message: str
+
+    @classmethod
+    def per_period(
+        cls, limit_type: str, requests: int, period_seconds: int, message: str
+    ) -> "GCRALimit":
+        """Build a limit allowing ``requests`` per ``period_seconds``."""
+        period_ns = period_seconds * NANOSECONDS_PER_SECOND
+        # A non-positive limit admits nothing: one emission interval already
+        # overshoots the period
+        increment_ns = period_ns // requests if requests > 0 else period_ns + 1
+        return cls(limit_type, period_ns, increment_ns, message)
+
 
 class RateLimitingMiddleware(BaseHTTPMiddleware):
     """
-    Rate limiting middleware with sliding window algorithm.
+    Rate limiting middleware using the Generic Cell Rate Algorithm (GCRA).
 
     Implements per-IP rate limiting with configurable thresholds
-    and time windows to prevent abuse and DDoS attacks.
+    and time windows to prevent abuse and DDoS attacks. Each limit keeps
+    a single theoretical arrival time (TAT) per client instead of a
+    history of request timestamps, so every admission decision is O(1).
     """
 
     def __init__(self, app, config: Settings):
@@ -32,10 +59,35 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         self.requests_per_hour = getattr(config, "rate_limit_requests_per_hour", 1000)
         self.burst_limit = getattr(config, "rate_limit_burst_limit", 10)
 
-        # Sliding window storage: IP -> deque of timestamps
-        self.request_windows: dict[str, deque] = defaultdict(lambda: deque())
+        # The per-minute limit also drives the response quota headers
+        self.minute_limit = GCRALimit.per_period(
+            "per_minute",
+            self.requests_per_minute,
+            60,
+            "Rate limit exceeded - too many requests per minute",
+        )
+        # Checked in order; each client keeps one TAT per limit, in this order
+        self.limits = (
+            GCRALimit.per_period(
+                "burst",
+                self.burst_limit,
+                10,
+                "Rate limit exceeded - too many requests in short time",
+            ),
+            self.minute_limit,
+            GCRALimit.per_period(
+                "per_hour",
+                self.requests_per_hour,
+                3600,
+                "Rate limit exceeded - too many requests per hour",
+            ),
+        )
+        self._minute_limit_index = self.limits.index(self.minute_limit)
+
+        # GCRA storage: IP -> TAT per limit, in time.monotonic_ns() units
+        self.arrival_times: dict[str, list[int]] = {}
         self.cleanup_interval = 300  # Clean up old entries every 5 minutes
-        self.last_cleanup = time.time()
+        self.last_cleanup = time.monotonic_ns()
 
         # Whitelist for trusted IPs (localhost, internal networks)
         self.whitelisted_ips = self._get_whitelisted_ips()
@@ -65,18 +117,13 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
             return False
 
     def _cleanup_old_entries(self):
-        """Clean up old request timestamps."""
-        current_time = time.time()
-        cutoff_time = current_time - 3600  # Remove entries older than 1 hour
+        """Drop clients whose limits have fully replenished."""
+        current_time = time.monotonic_ns()
 
-        for ip, window in list(self.request_windows.items()):
-            # Remove old timestamps
-            while window and window[0] < cutoff_time:
-                window.popleft()
-
-            # Remove empty windows
-            if not window:
-                del self.request_windows[ip]
+        # A TAT in the past carries no state beyond a fresh client's
+        for ip, arrival_times in list(self.arrival_times.items()):
+            if max(arrival_times) <= current_time:
+                del self.arrival_times[ip]
 
         self.last_cleanup = current_time
 
@@ -90,51 +137,55 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         if self._is_whitelisted(ip):
             return None
 
-        current_time = time.time()
+        current_time = time.monotonic_ns()
 
         # Cleanup old entries periodically
-        if current_time - self.last_cleanup > self.cleanup_interval:
+        if (
+            current_time - self.last_cleanup
+            > self.cleanup_interval * NANOSECONDS_PER_SECOND
+        ):
             self._cleanup_old_entries()
 
-        window = self.request_windows[ip]
-
-        # Check burst limit (requests in last 10 seconds)
-        burst_cutoff = current_time - 10
-        burst_count = sum(1 for ts in window if ts > burst_cutoff)
-
-        if burst_count >= self.burst_limit:
-            return {
-                "error": "Rate limit exceeded - too many requests in short time",
-                "retry_after": 10,
-                "limit_type": "burst",
-            }
-
-        # Check per-minute limit
-        minute_cutoff = current_time - 60
-        minute_count = sum(1 for ts in window if ts > minute_cutoff)
+        arrival_times = self.arrival_times.get(ip)
+        if arrival_times is None:
+            arrival_times = [current_time] * len(self.limits)
+
+        new_arrival_times = []
+        for limit, arrival_time in zip(self.limits, arrival_times, strict=True):
+            new_arrival_time = max(arrival_time, current_time) + limit.increment_ns
+            if new_arrival_time - current_time > limit.period_ns:
+                overshoot_ns = new_arrival_time - current_time - limit.period_ns
+                return {
+                    "error": limit.message,
+                    "retry_after": max(
+                        1, math.ceil(overshoot_ns / NANOSECONDS_PER_SECOND)
+                    ),
+                    "limit_type": limit.limit_type,
+                }
+            new_arrival_times.append(new_arrival_time)
+
+        # Record this request only once every limit has admitted it
+        self.arrival_times[ip] = new_arrival_times
 
-        if minute_count >= self.requests_per_minute:
-            return {
-                "error": "Rate limit exceeded - too many requests per minute",
-                "retry_after": 60,
-                "limit_type": "per_minute",
-            }
-
-        # Check per-hour limit
-        hour_cutoff = current_time - 3600
-        hour_count = sum(1 for ts in window if ts > hour_cutoff)
+        return None
 
-        if hour_count >= self.requests_per_hour:
-            return {
-                "error": "Rate limit exceeded - too many requests per hour",
-                "retry_after": 3600,
-                "limit_type": "per_hour",
-            }
+    def _get_minute_quota(self, ip: str) -> tuple[int, float]:
+        """
+        Get the remaining per-minute quota for an IP.
 
-        # Record this request
-        window.append(current_time)
+        Returns:
+            Tuple of requests remaining and seconds until the quota is full again
+        """
+        limit = self.minute_limit
+        current_time = time.monotonic_ns()
+        arrival_times = self.arrival_times.get(ip)
+        arrival_time = (
+            arrival_times[self._minute_limit_index] if arrival_times else current_time
+        )
 
-        return None
+        delay_ns = max(0, arrival_time - current_time)
+        remaining = max(0, (limit.period_ns - delay_ns) // limit.increment_ns)
+        return remaining, delay_ns / NANOSECONDS_PER_SECOND
 
     async def dispatch(self, request: Request, call_next):
         """Process request with rate limiting."""
@@ -167,15 +218,13 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         # Add rate limit headers
-        window = self.request_windows[client_ip]
-        current_time = time.time()
-        minute_cutoff = current_time - 60
-        minute_count = sum(1 for ts in window if ts > minute_cutoff)
-        remaining = max(0, self.requests_per_minute - minute_count)
+        remaining, reset_after = self._get_minute_quota(client_ip)
 
         response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
         response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(current_time + 60))
+        response.headers["X-RateLimit-Reset"] = str(
+            math.ceil(time.time() + reset_after)
+        )
 
         return response
 
@@ -198,16 +247,17 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         return "unknown"
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Security headers middleware.
 
     Adds security-related HTTP headers to all responses
-    to protect against common web vulnerabilities.
+    to protect against common web vulnerabilities. Implemented as pure
+    ASGI so the headers are spliced into the raw response start message.
     """
 
-    def __init__(self, app, config: Settings):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, config: Settings):
+        self.app = app
         self.config = config
 
         # Security headers configuration
@@ -221,6 +271,16 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "Permissions-Policy": self._get_permissions_policy(),
         }
 
+        # Encoded once, then appended to every response as raw ASGI headers
+        self.raw_security_headers = [
+            (header.lower().encode("latin-1"), value.encode("latin-1"))
+            for header, value in self.security_headers.items()
+        ]
+        # Headers from the app that are replaced by ours, or removed (Server)
+        self.stripped_header_names = frozenset(
+            header for header, _ in self.raw_security_headers
+        ) | {b"server"}
+
     def _get_csp_policy(self) -> str:
         """Get Content Security Policy."""
         return (
@@ -248,19 +308,24 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "accelerometer=()"
         )
 
-    async def dispatch(self, request: Request, call_next):
-        """Add security headers to response."""
-        response = await call_next(request)
-
-        # Add security headers
-        for header, value in self.security_headers.items():
-            response.headers[header] = value
-
-        # Add server header removal
-        if "Server" in response.headers:
-            del response.headers["Server"]
-
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to HTTP responses."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name.lower() not in self.stripped_header_names
+                ]
+                headers.extend(self.raw_security_headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
 
 
 class InputValidationMiddleware(BaseHTTPMiddleware):
@@ -0,0 +1,32 @@
+# ABOUTME: Shared pytest fixtures for the unit test suite
+# ABOUTME: Exposes the A2A test doubles from tests.test_utils and a SummariseAgent as fixtures
+
+from collections.abc import Callable, Iterator
+from unittest.mock import patch
+
+import pytest
+
+from reddit_watcher.agents.summarise_agent import SummariseAgent
+from reddit_watcher.config import create_config
+from tests.test_utils import FakeEventQueue, FakeRequestContext, create_test_context
+
+
+@pytest.fixture
+def fake_event_queue() -> Iterator[FakeEventQueue]:
+    """Provide a FakeEventQueue that is reset after the test."""
+    queue = FakeEventQueue()
+    yield queue
+    queue.reset()
+
+
+@pytest.fixture
+def request_context_factory() -> Callable[..., FakeRequestContext]:
+    """Provide a factory building FakeRequestContext instances."""
+    return create_test_context
+
+
+@pytest.fixture
+def summarise_agent() -> SummariseAgent:
+    """Provide a SummariseAgent built without configuring the Gemini client."""
+    with patch("reddit_watcher.agents.summarise_agent.genai.configure"):
+        return SummariseAgent(create_config())
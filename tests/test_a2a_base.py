@@ -10,7 +10,6 @@ from reddit_watcher.agents.base import (
 )
 from reddit_watcher.agents.test_agent import MockA2AAgent
 from reddit_watcher.config import create_config, reset_settings
-from tests.test_utils import create_test_context, create_test_event_queue
 
 
 class TestBaseA2AAgent:
@@ -177,99 +176,102 @@ class TestBaseA2AAgentExecutor:
         assert executor.logger is not None
 
     @pytest.mark.asyncio
-    async def test_execute_with_json_message(self):
+    async def test_execute_with_json_message(
+        self, fake_event_queue, request_context_factory
+    ):
         """Test executor with JSON message."""
         config = create_config()
         agent = MockA2AAgent(config)
         executor = BaseA2AAgentExecutor(agent)
 
-        # Create test context and event queue
-        context = create_test_context(
+        # Create test context
+        context = request_context_factory(
             message=json.dumps({"skill": "health_check", "parameters": {}})
         )
-        event_queue = create_test_event_queue()
 
-        await executor.execute(context, event_queue)
+        await executor.execute(context, fake_event_queue)
 
         # Should have enqueued an event
-        event_queue.assert_event_enqueued()
+        fake_event_queue.assert_event_enqueued()
 
         # Check the event content
-        events = event_queue.get_events()
+        events = fake_event_queue.get_events()
         assert len(events) == 1
         assert events[0]["type"] == "agent_message"
 
     @pytest.mark.asyncio
-    async def test_execute_with_text_message(self):
+    async def test_execute_with_text_message(
+        self, fake_event_queue, request_context_factory
+    ):
         """Test executor with text message."""
         config = create_config()
         agent = MockA2AAgent(config)
         executor = BaseA2AAgentExecutor(agent)
 
-        # Create test context and event queue
-        context = create_test_context(message="Hello, test agent!")
-        event_queue = create_test_event_queue()
+        # Create test context
+        context = request_context_factory(message="Hello, test agent!")
 
-        await executor.execute(context, event_queue)
+        await executor.execute(context, fake_event_queue)
 
         # Should have enqueued an event (health check fallback)
-        event_queue.assert_event_enqueued()
+        fake_event_queue.assert_event_enqueued()
 
         # Verify it executed health_check as fallback
-        events = event_queue.get_events()
+        events = fake_event_queue.get_events()
         assert len(events) == 1
         event_content = json.loads(events[0]["content"])
         assert event_content["skill"] == "health_check"
 
     @pytest.mark.asyncio
-    async def test_execute_with_no_message(self):
+    async def test_execute_with_no_message(
+        self, fake_event_queue, request_context_factory
+    ):
         """Test executor with no message."""
         config = create_config()
         agent = MockA2AAgent(config)
         executor = BaseA2AAgentExecutor(agent)
 
         # Create test context with no message
-        context = create_test_context(message=None)
-        event_queue = create_test_event_queue()
+        context = request_context_factory(message=None)
 
-        await executor.execute(context, event_queue)
+        await executor.execute(context, fake_event_queue)
 
         # Should have enqueued an error event
-        event_queue.assert_event_enqueued("No message provided")
+        fake_event_queue.assert_event_enqueued("No message provided")
 
     @pytest.mark.asyncio
-    async def test_execute_with_no_skill(self):
+    async def test_execute_with_no_skill(
+        self, fake_event_queue, request_context_factory
+    ):
         """Test executor with message but no skill."""
         config = create_config()
         agent = MockA2AAgent(config)
         executor = BaseA2AAgentExecutor(agent)
 
         # Create test context with message but no skill
-        context = create_test_context(
+        context = request_context_factory(
             message=json.dumps({"parameters": {}})  # No skill field
         )
-        event_queue = create_test_event_queue()
 
-        await executor.execute(context, event_queue)
+        await executor.execute(context, fake_event_queue)
 
         # Should have enqueued an error event
-        event_queue.assert_event_enqueued("No skill specified")
+        fake_event_queue.assert_event_enqueued("No skill specified")
 
     @pytest.mark.asyncio
-    async def test_cancel_task(self):
+    async def test_cancel_task(self, fake_event_queue, request_context_factory):
         """Test task cancellation."""
         config = create_config()
         agent = MockA2AAgent(config)
         executor = BaseA2AAgentExecutor(agent)
 
-        # Create test context and event queue
-        context = create_test_context(message="cancel")
-        event_queue = create_test_event_queue()
+        # Create test context
+        context = request_context_factory(message="cancel")
 
-        await executor.cancel(context, event_queue)
+        await executor.cancel(context, fake_event_queue)
 
         # Should have enqueued a cancellation event
-        event_queue.assert_event_enqueued("cancelled")
+        fake_event_queue.assert_event_enqueued("cancelled")
 
     def test_parse_json_request(self):
         """Test parsing JSON request."""
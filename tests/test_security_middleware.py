@@ -0,0 +1,192 @@
+# ABOUTME: Test suite for the security middleware stack protecting A2A agent endpoints
+# ABOUTME: Covers GCRA rate limiting, response quota headers, and security header injection
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from reddit_watcher.config import create_config
+from reddit_watcher.security_middleware import (
+    NANOSECONDS_PER_SECOND,
+    RateLimitingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+CLIENT_IP = "8.8.8.8"
+
+
+class TestRateLimitingMiddleware:
+    """Test suite for GCRA-based RateLimitingMiddleware."""
+
+    @pytest.fixture
+    def config(self):
+        """Create a config with small, easy to exhaust limits."""
+        config = create_config()
+        config.rate_limit_burst_limit = 3
+        config.rate_limit_requests_per_minute = 6
+        config.rate_limit_requests_per_hour = 100
+        return config
+
+    @pytest.fixture
+    def clock(self):
+        """Freeze the middleware's monotonic clock; advance via return_value."""
+        with patch(
+            "reddit_watcher.security_middleware.time.monotonic_ns",
+            return_value=1_000 * NANOSECONDS_PER_SECOND,
+        ) as mock_clock:
+            yield mock_clock
+
+    @pytest.fixture
+    def middleware(self, config, clock):
+        """Create a RateLimitingMiddleware around a dummy app."""
+        return RateLimitingMiddleware(MagicMock(), config=config)
+
+    def advance(self, clock, seconds: float) -> None:
+        """Move the patched monotonic clock forward."""
+        clock.return_value += int(seconds * NANOSECONDS_PER_SECOND)
+
+    def test_burst_limit_rejects_after_limit(self, middleware):
+        """Test the burst limit admits exactly its capacity at once."""
+        for _ in range(3):
+            assert middleware._check_rate_limit(CLIENT_IP) is None
+
+        error = middleware._check_rate_limit(CLIENT_IP)
+
+        assert error["limit_type"] == "burst"
+        # One emission interval (10s / 3) must pass before the next request
+        assert error["retry_after"] == 4
+
+    def test_quota_replenishes_one_interval_at_a_time(self, middleware, clock):
+        """Test a rejected client is admitted again after one emission interval."""
+        for _ in range(3):
+            middleware._check_rate_limit(CLIENT_IP)
+
+        self.advance(clock, 10 / 3)
+
+        assert middleware._check_rate_limit(CLIENT_IP) is None
+        assert middleware._check_rate_limit(CLIENT_IP)["limit_type"] == "burst"
+
+    def test_rejected_requests_do_not_consume_quota(self, middleware, clock):
+        """Test requests rejected by one limit leave every limit untouched."""
+        for _ in range(3):
+            middleware._check_rate_limit(CLIENT_IP)
+        arrival_times = list(middleware.arrival_times[CLIENT_IP])
+
+        for _ in range(5):
+            assert middleware._check_rate_limit(CLIENT_IP) is not None
+
+        assert middleware.arrival_times[CLIENT_IP] == arrival_times
+
+    def test_per_minute_limit(self, middleware, clock):
+        """Test the per-minute limit applies once bursts are spread out."""
+        # Every 4s stays under the burst rate but outpaces one per 10s, so
+        # per-minute delay builds up by 6s per request until it overflows
+        for _ in range(9):
+            assert middleware._check_rate_limit(CLIENT_IP) is None
+            self.advance(clock, 4)
+
+        assert middleware._check_rate_limit(CLIENT_IP)["limit_type"] == "per_minute"
+
+    def test_zero_limit_rejects_everything(self, config, clock):
+        """Test a limit of zero admits no requests."""
+        config.rate_limit_burst_limit = 0
+        middleware = RateLimitingMiddleware(MagicMock(), config=config)
+
+        assert middleware._check_rate_limit(CLIENT_IP)["limit_type"] == "burst"
+
+    def test_whitelisted_ip_is_not_tracked(self, middleware):
+        """Test whitelisted clients bypass rate limiting entirely."""
+        for _ in range(10):
+            assert middleware._check_rate_limit("127.0.0.1") is None
+
+        assert "127.0.0.1" not in middleware.arrival_times
+
+    def test_minute_quota_counts_down(self, middleware):
+        """Test remaining per-minute quota reflects admitted requests."""
+        assert middleware._get_minute_quota(CLIENT_IP) == (6, 0.0)
+
+        middleware._check_rate_limit(CLIENT_IP)
+        remaining, reset_after = middleware._get_minute_quota(CLIENT_IP)
+
+        assert remaining == 5
+        assert reset_after == 10.0
+
+    def test_cleanup_drops_replenished_clients(self, middleware, clock):
+        """Test cleanup only forgets clients whose limits have fully replenished."""
+        middleware._check_rate_limit(CLIENT_IP)
+        middleware._check_rate_limit("8.8.4.4")
+        self.advance(clock, 36)
+        middleware._check_rate_limit("8.8.4.4")
+
+        middleware._cleanup_old_entries()
+
+        assert CLIENT_IP not in middleware.arrival_times
+        assert "8.8.4.4" in middleware.arrival_times
+
+    def test_dispatch_sets_rate_limit_headers(self, config):
+        """Test responses carry rate limit headers and 429 once exhausted."""
+        app = FastAPI()
+        app.add_middleware(RateLimitingMiddleware, config=config)
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        client = TestClient(app)
+        remaining = [
+            client.get("/ping").headers["X-RateLimit-Remaining"] for _ in range(3)
+        ]
+        response = client.get("/ping")
+
+        assert remaining == ["5", "4", "3"]
+        assert response.status_code == 429
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+        assert int(response.headers["Retry-After"]) >= 1
+
+
+class TestSecurityHeadersMiddleware:
+    """Test suite for ASGI SecurityHeadersMiddleware."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client for an app wrapped in SecurityHeadersMiddleware."""
+        app = FastAPI()
+        app.add_middleware(SecurityHeadersMiddleware, config=create_config())
+
+        @app.get("/plain")
+        async def plain():
+            return {"ok": True}
+
+        @app.get("/custom")
+        async def custom():
+            return Response(
+                "ok",
+                headers={
+                    "X-Frame-Options": "SAMEORIGIN",
+                    "Server": "leaky/1.0",
+                    "X-Custom": "kept",
+                },
+            )
+
+        return TestClient(app)
+
+    def test_security_headers_added(self, client):
+        """Test every configured security header is added to responses."""
+        response = client.get("/plain")
+
+        assert response.status_code == 200
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "default-src 'self'" in response.headers["Content-Security-Policy"]
+        assert "camera=()" in response.headers["Permissions-Policy"]
+
+    def test_app_headers_replaced_and_server_removed(self, client):
+        """Test security headers override app values and Server is stripped."""
+        response = client.get("/custom")
+
+        assert response.headers.get_list("X-Frame-Options") == ["DENY"]
+        assert "Server" not in response.headers
+        assert response.headers["X-Custom"] == "kept"
+        assert response.text == "ok"
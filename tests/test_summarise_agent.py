@@ -2,32 +2,38 @@
 # ABOUTME: Covers A2A skills, rate limiting, chunking, and error handling scenarios
 
 import asyncio
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import spacy
 
-from reddit_watcher.agents.summarise_agent import RateLimitState, SummariseAgent
+from reddit_watcher.agents.summarise_agent import RateLimitState
+from tests.test_utils import FakeClock
 
 
 class TestSummariseAgent:
     """Test suite for SummariseAgent A2A functionality."""
 
     @pytest.fixture
-    def agent(self):
-        """Create a SummariseAgent for testing."""
-        with patch("reddit_watcher.agents.summarise_agent.genai.configure"):
-            return SummariseAgent()
-
-    def test_agent_initialization(self, agent):
+    def mock_genai(self):
+        """Patch the genai module used by the agent for the duration of a test."""
+        patcher = patch("reddit_watcher.agents.summarise_agent.genai")
+        mock = patcher.start()
+        yield mock
+        patcher.stop()
+
+    def test_agent_initialization(self, summarise_agent):
         """Test that SummariseAgent initializes correctly."""
-        assert agent.agent_type == "summarise"
-        assert agent.name == "Content Summarization Agent"
-        assert agent.version == "1.0.0"
-        assert isinstance(agent._rate_limit_state, RateLimitState)
+        assert summarise_agent.agent_type == "summarise"
+        assert summarise_agent.name == "Content Summarization Agent"
+        assert summarise_agent.version == "1.0.0"
+        assert isinstance(summarise_agent._rate_limit_state, RateLimitState)
 
-    def test_get_skills(self, agent):
+    def test_get_skills(self, summarise_agent):
         """Test that agent returns correct skills."""
-        skills = agent.get_skills()
+        skills = summarise_agent.get_skills()
         assert len(skills) == 2
 
         # Check health check skill
@@ -44,96 +50,204 @@ class TestSummariseAgent:
         assert "summarize" in summarize_skill.tags
         assert "gemini" in summarize_skill.tags
 
-    @pytest.mark.asyncio
-    async def test_execute_skill_unknown_skill(self, agent):
-        """Test execution of unknown skill returns error."""
-        result = await agent.execute_skill("unknownSkill", {})
-
-        assert result["success"] is False
-        assert "Unknown skill" in result["error"]
-        assert "available_skills" in result
-
-    @pytest.mark.asyncio
-    async def test_execute_skill_missing_content(self, agent):
-        """Test execution without required content parameter."""
-        result = await agent.execute_skill("summarizeContent", {})
-
-        assert result["success"] is False
-        assert "Content parameter is required" in result["error"]
-
-    @pytest.mark.asyncio
-    async def test_execute_skill_empty_content(self, agent):
-        """Test execution with empty content parameter."""
-        result = await agent.execute_skill("summarizeContent", {"content": ""})
+    def test_get_skills_is_cached(self, summarise_agent):
+        """Test that skills are built once and reused across calls."""
+        assert summarise_agent.get_skills() is summarise_agent.get_skills()
+        assert summarise_agent.generate_agent_card().skills == list(
+            summarise_agent.get_skills()
+        )
+
+    @pytest.mark.parametrize(
+        "skill,params,error,extra_keys",
+        [
+            ("unknownSkill", {}, "Unknown skill", ("available_skills",)),
+            ("summarizeContent", {}, "Content parameter is required", ()),
+            (
+                "summarizeContent",
+                {"content": ""},
+                "Content parameter is required",
+                (),
+            ),
+        ],
+        ids=["unknown_skill", "missing_content", "empty_content"],
+    )
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_execute_skill_errors(
+        self, summarise_agent, skill, params, error, extra_keys
+    ):
+        """Test skill execution error responses."""
+        result = await summarise_agent.execute_skill(skill, params)
 
         assert result["success"] is False
-        assert "Content parameter is required" in result["error"]
+        assert error in result["error"]
+        for key in extra_keys:
+            assert key in result
 
-    def test_split_content_recursively_small_content(self, agent):
+    def test_split_content_recursively_small_content(self, summarise_agent):
         """Test content splitting with small content."""
         content = "This is a short piece of content."
-        chunks = agent._split_content_recursively(content, max_chunk_size=1000)
+        chunks = summarise_agent._split_content_recursively(
+            content, max_chunk_size=1000
+        )
 
         assert len(chunks) == 1
         assert chunks[0] == content
 
-    def test_split_content_recursively_large_content(self, agent):
+    def test_split_content_recursively_large_content(self, summarise_agent):
         """Test content splitting with large content."""
         # Create content larger than chunk size
         content = "This is a sentence. " * 500  # Should exceed default chunk size
-        chunks = agent._split_content_recursively(content, max_chunk_size=1000)
+        chunks = summarise_agent._split_content_recursively(
+            content, max_chunk_size=1000
+        )
 
         assert len(chunks) > 1
         for chunk in chunks:
             assert len(chunk) <= 1000
+        assert "".join(chunks) == content
+
+    @pytest.mark.parametrize(
+        "content,separator",
+        [
+            (
+                "\n\n".join(f"Paragraph {i}. " + "Text. " * 40 for i in range(20)),
+                "\n\n",
+            ),
+            ("\n".join(f"Line {i}. " + "Text. " * 40 for i in range(20)), "\n"),
+            ("".join(f"Sentence number {i} here. " for i in range(200)), ". "),
+            (" ".join(f"word{i}" for i in range(1000)), " "),
+        ],
+        ids=["paragraphs", "lines", "sentences", "words"],
+    )
+    def test_split_content_recursively_separator_priority(
+        self, summarise_agent, content, separator
+    ):
+        """Test that the coarsest available separator is used for splitting."""
+        chunks = summarise_agent._split_content_recursively(
+            content, max_chunk_size=1000
+        )
 
-    def test_extractive_summarization_basic(self, agent):
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert "".join(chunks) == content
+        # Every chunk but the last must end on the expected boundary, otherwise
+        # the splitter fell through to a finer separator than necessary
+        assert all(chunk.endswith(separator) for chunk in chunks[:-1])
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "This is a sentence. " * 500,
+            "Intro line.\n" + ("Body text here. " * 80 + "\n\n") * 10,
+            "x" * 2500,
+            "word " * 300 + "y" * 1500 + "\n\nTail paragraph.",
+        ],
+        ids=["sentences", "mixed", "unbroken", "oversized_word"],
+    )
+    def test_split_content_recursively_is_lossless(self, summarise_agent, content):
+        """Test that splitting neither drops nor duplicates content."""
+        chunks = summarise_agent._split_content_recursively(
+            content, max_chunk_size=1000
+        )
+
+        assert all(0 < len(chunk) <= 1000 for chunk in chunks)
+        # Chunks do not overlap, so they must reassemble to the exact input
+        assert sum(len(chunk) for chunk in chunks) == len(content)
+        assert "".join(chunks) == content
+
+    def test_extractive_summarization_basic(self, summarise_agent):
         """Test extractive summarization with basic functionality."""
         content = "First sentence. Second sentence. Third sentence. Fourth sentence."
-        summary = agent._extractive_summarization(content, max_sentences=2)
+        summary = summarise_agent._extractive_summarization(content, max_sentences=2)
 
         assert len(summary) > 0
         assert len(summary) <= len(content)
 
-    def test_extractive_summarization_short_content(self, agent):
+    def test_extractive_summarization_short_content(self, summarise_agent):
         """Test extractive summarization with content shorter than max sentences."""
         content = "Short content."
-        summary = agent._extractive_summarization(content, max_sentences=3)
+        summary = summarise_agent._extractive_summarization(content, max_sentences=3)
 
         # Should return original content if shorter than max_sentences
         assert summary == content
 
-    @pytest.mark.asyncio
-    async def test_rate_limiting_initialization(self, agent):
+    def test_extractive_summarization_prefers_frequent_terms(self, summarise_agent):
+        """Test extractive summarization selects sentences on the main topic."""
+        content = (
+            "Claude code agents use tools. "
+            "The weather was mild. "
+            "Claude code agents write code. "
+            "Lunch was served at noon."
+        )
+        summary = summarise_agent._extractive_summarization(content, max_sentences=2)
+
+        assert summary == "Claude code agents use tools. Claude code agents write code."
+
+    def test_extractive_summarization_large(self, summarise_agent):
+        """Test extractive summarization keeps document order on large input."""
+        sentences = [
+            f"Sentence {i} covers topic {i % 7} in detail." for i in range(2000)
+        ]
+        content = " ".join(sentences)
+
+        summary = summarise_agent._extractive_summarization(content, max_sentences=5)
+
+        selected = [s for s in sentences if s in summary]
+        assert len(selected) == 5
+        assert summary == " ".join(selected)
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_rate_limiting_initialization(self, summarise_agent):
         """Test rate limiting state initialization."""
-        assert agent._rate_limit_state.requests_made == 0
-        assert agent._rate_limit_state.max_requests_per_minute == 100
+        assert summarise_agent._rate_limit_state.requests_made == 0
+        assert summarise_agent._rate_limit_state.max_requests_per_minute == 100
 
-    @pytest.mark.asyncio
-    async def test_rate_limiting_check_normal(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_rate_limiting_check_normal(self, summarise_agent):
         """Test rate limiting check under normal conditions."""
         # Should complete without delay
-        await agent._check_rate_limit()
-        assert agent._rate_limit_state.requests_made == 0
-
-    @pytest.mark.asyncio
-    async def test_rate_limiting_check_at_limit(self, agent):
-        """Test rate limiting when at request limit."""
-        # Set requests to limit
-        agent._rate_limit_state.requests_made = 100
-        agent._rate_limit_state.window_start = asyncio.get_event_loop().time()
-
-        # Should reset window since requests_made is at limit
-        start_time = asyncio.get_event_loop().time()
-        await agent._check_rate_limit()
-        end_time = asyncio.get_event_loop().time()
-
-        # Should have taken some time due to rate limiting
-        assert end_time >= start_time
-
-    @pytest.mark.asyncio
-    @patch("reddit_watcher.agents.summarise_agent.genai")
-    async def test_summarize_with_gemini_success(self, mock_genai, agent):
+        await summarise_agent._check_rate_limit()
+        assert summarise_agent._rate_limit_state.requests_made == 0
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_rate_limiting_check_at_limit(self, summarise_agent):
+        """Test rate limiting blocks for the remainder of the window at the limit."""
+        summarise_agent._rate_limit_state.requests_made = 100
+        summarise_agent._rate_limit_state.window_start = 0.0
+
+        # 10 seconds into a 60 second window, then the post-sleep reset
+        summarise_agent._rate_limit_state.time_fn = FakeClock([10.0, 60.0])
+
+        with patch(
+            "reddit_watcher.agents.summarise_agent.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            await summarise_agent._check_rate_limit()
+
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.await_args.args[0] == pytest.approx(50.0, abs=1)
+        assert summarise_agent._rate_limit_state.requests_made == 0
+        assert summarise_agent._rate_limit_state.window_start == 60.0
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_rate_limiting_check_window_rollover(self, summarise_agent):
+        """Test rate limiting resets the counter once the window has elapsed."""
+        summarise_agent._rate_limit_state.requests_made = 100
+        summarise_agent._rate_limit_state.window_start = 0.0
+        summarise_agent._rate_limit_state.time_fn = FakeClock([61.0])
+
+        with patch(
+            "reddit_watcher.agents.summarise_agent.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            await summarise_agent._check_rate_limit()
+
+        mock_sleep.assert_not_awaited()
+        assert summarise_agent._rate_limit_state.requests_made == 0
+        assert summarise_agent._rate_limit_state.window_start == 61.0
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_with_gemini_success(self, summarise_agent, mock_genai):
         """Test successful Gemini summarization."""
         # Mock Gemini response
         mock_model = MagicMock()
@@ -142,28 +256,30 @@ class TestSummariseAgent:
         mock_model.generate_content.return_value = mock_response
         mock_genai.GenerativeModel.return_value = mock_model
 
-        agent._gemini_initialized = True
+        summarise_agent._gemini_initialized = True
 
-        result = await agent._summarize_with_gemini("Test content")
+        result = await summarise_agent._summarize_with_gemini("Test content")
 
         assert result == "This is a generated summary."
         mock_genai.GenerativeModel.assert_called_once()
         mock_model.generate_content.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("reddit_watcher.agents.summarise_agent.genai")
-    async def test_summarize_with_gemini_not_initialized(self, mock_genai, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_with_gemini_not_initialized(
+        self, summarise_agent, mock_genai
+    ):
         """Test Gemini summarization when not initialized."""
-        agent._gemini_initialized = False
+        summarise_agent._gemini_initialized = False
 
-        result = await agent._summarize_with_gemini("Test content")
+        result = await summarise_agent._summarize_with_gemini("Test content")
 
         assert result is None
         mock_genai.GenerativeModel.assert_not_called()
 
-    @pytest.mark.asyncio
-    @patch("reddit_watcher.agents.summarise_agent.genai")
-    async def test_summarize_with_gemini_empty_response(self, mock_genai, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_with_gemini_empty_response(
+        self, summarise_agent, mock_genai
+    ):
         """Test Gemini summarization with empty response."""
         # Mock empty response
         mock_model = MagicMock()
@@ -172,66 +288,299 @@ class TestSummariseAgent:
         mock_model.generate_content.return_value = mock_response
         mock_genai.GenerativeModel.return_value = mock_model
 
-        agent._gemini_initialized = True
+        summarise_agent._gemini_initialized = True
 
-        result = await agent._summarize_with_gemini("Test content")
+        result = await summarise_agent._summarize_with_gemini("Test content")
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_summarize_content_chunks_single_chunk(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_with_gemini_caches_identical_prompts(
+        self, summarise_agent, mock_genai
+    ):
+        """Test repeated prompts are served from the prompt cache."""
+        mock_model = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text = "Cached summary."
+        mock_model.generate_content.return_value = mock_response
+        mock_genai.GenerativeModel.return_value = mock_model
+
+        summarise_agent._gemini_initialized = True
+
+        first = await summarise_agent._summarize_with_gemini("Test content")
+        second = await summarise_agent._summarize_with_gemini("Test content")
+
+        assert first == second == "Cached summary."
+        assert mock_model.generate_content.call_count == 1
+        assert summarise_agent._rate_limit_state.requests_made == 1
+
+        # Cache entries are per model and can be bypassed explicitly
+        await summarise_agent._summarize_with_gemini(
+            "Test content", use_fallback_model=True
+        )
+        await summarise_agent._summarize_with_gemini("Test content", use_cache=False)
+        assert mock_model.generate_content.call_count == 3
+
+    @pytest.mark.asyncio(loop_scope="class")
+    @patch("reddit_watcher.agents.summarise_agent.PROMPT_CACHE_SIZE", 2)
+    async def test_summarize_with_gemini_cache_is_bounded(
+        self, summarise_agent, mock_genai
+    ):
+        """Test the prompt cache evicts least recently used entries."""
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = MagicMock(text="Summary.")
+        mock_genai.GenerativeModel.return_value = mock_model
+
+        summarise_agent._gemini_initialized = True
+
+        for content in ("first", "second", "third"):
+            await summarise_agent._summarize_with_gemini(content)
+
+        assert len(summarise_agent._prompt_cache) == 2
+        await summarise_agent._summarize_with_gemini("first")
+        assert mock_model.generate_content.call_count == 4
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_content_chunks_single_chunk(self, summarise_agent):
         """Test summarizing single content chunk."""
         chunks = ["This is test content for summarization."]
 
-        with patch.object(agent, "_summarize_with_gemini", return_value="AI summary"):
-            result = await agent._summarize_content_chunks(chunks)
+        with patch.object(
+            summarise_agent, "_summarize_with_gemini", return_value="AI summary"
+        ):
+            result = await summarise_agent._summarize_content_chunks(chunks)
 
         assert result == "AI summary"
 
-    @pytest.mark.asyncio
-    async def test_summarize_content_chunks_multiple_chunks(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_content_chunks_multiple_chunks(self, summarise_agent):
         """Test summarizing multiple content chunks."""
         chunks = ["First chunk.", "Second chunk."]
 
-        # Mock AI summarization to return summaries for each chunk
+        # Chunk summaries are joined with blank lines before the final pass
+        responses = {
+            "First chunk.": "First summary",
+            "Second chunk.": "Second summary",
+            "First summary\n\nSecond summary": "Combined summary",
+        }
+
         def mock_summarize(content, use_fallback_model=False):
-            if "First chunk." in content:
-                return "First summary"
-            elif "Second chunk." in content:
-                return "Second summary"
-            elif "First summary" in content and "Second summary" in content:
-                return "Combined summary"
-            return None
+            return responses.get(content)
 
-        with patch.object(agent, "_summarize_with_gemini", side_effect=mock_summarize):
-            result = await agent._summarize_content_chunks(chunks)
+        with patch.object(
+            summarise_agent, "_summarize_with_gemini", side_effect=mock_summarize
+        ):
+            result = await summarise_agent._summarize_content_chunks(chunks)
 
         assert result == "Combined summary"
 
-    @pytest.mark.asyncio
-    async def test_summarize_content_chunks_ai_failure_extractive_fallback(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_content_chunks_runs_concurrently(self, summarise_agent):
+        """Test that chunks are summarized concurrently and kept in order."""
+        chunks = [f"Chunk {i}." for i in range(10)]
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def tracked_summarize(content, use_fallback_model=False):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            # Yield so every other chunk task gets to start before this returns
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"Summary of {content}"
+
+        with patch.object(
+            summarise_agent, "_summarize_with_gemini", side_effect=tracked_summarize
+        ) as mock_summarize:
+            result = await summarise_agent._summarize_content_chunks(chunks)
+
+        assert peak_in_flight == len(chunks)
+        combined = mock_summarize.await_args_list[-1].args[0]
+        assert combined == "\n\n".join(f"Summary of {chunk}" for chunk in chunks)
+        assert result == f"Summary of {combined}"
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_content_chunks_caps_in_flight(self, summarise_agent):
+        """Test no more chunks run at once than the per-minute request limit."""
+        chunks = [f"Chunk {i}." for i in range(10)]
+        summarise_agent._rate_limit_state.max_requests_per_minute = 3
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def tracked_summarize(content, use_fallback_model=False):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"Summary of {content}"
+
+        with patch.object(
+            summarise_agent, "_summarize_with_gemini", side_effect=tracked_summarize
+        ) as mock_summarize:
+            await summarise_agent._summarize_content_chunks(chunks)
+
+        assert peak_in_flight == 3
+        # Every chunk plus the combining request still ran
+        assert mock_summarize.await_count == len(chunks) + 1
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_content_chunks_failure_cancels_other_chunks(
+        self, summarise_agent
+    ):
+        """Test a failing chunk cancels the others and its error is raised."""
+        chunks = ["Failing chunk.", "Slow chunk.", "Other slow chunk."]
+        cancelled = []
+
+        async def summarize(content, use_fallback_model=False):
+            if content == "Failing chunk.":
+                raise RuntimeError("quota check failed")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(content)
+                raise
+
+        with (
+            patch.object(
+                summarise_agent, "_summarize_with_gemini", side_effect=summarize
+            ),
+            pytest.raises(RuntimeError, match="quota check failed"),
+        ):
+            await summarise_agent._summarize_content_chunks(chunks)
+
+        assert sorted(cancelled) == ["Other slow chunk.", "Slow chunk."]
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_concurrent_chunks_share_rate_limit(
+        self, summarise_agent, mock_genai
+    ):
+        """Test concurrent chunk requests are counted once each in one window."""
+        chunks = [f"Chunk {i}." for i in range(10)]
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = MagicMock(text="Summary")
+        mock_genai.GenerativeModel.return_value = mock_model
+
+        now = 0.0
+        state = summarise_agent._rate_limit_state
+        state.max_requests_per_minute = 4
+        state.time_fn = lambda: now
+        summarise_agent._gemini_initialized = True
+
+        async def advance_clock(seconds):
+            nonlocal now
+            now += seconds
+
+        with patch(
+            "reddit_watcher.agents.summarise_agent.asyncio.sleep",
+            new_callable=AsyncMock,
+            side_effect=advance_clock,
+        ) as mock_sleep:
+            await summarise_agent._summarize_content_chunks(chunks)
+
+        # Ten chunk requests plus the combining request, four per window
+        assert mock_model.generate_content.call_count == 11
+        assert mock_sleep.await_count == 2
+        assert state.requests_made == 3
+        assert state.window_start == 120.0
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_spacy_model_is_loaded_lazily(self, summarise_agent):
+        """Test spaCy is only loaded once the extractive fallback is needed."""
+        assert summarise_agent._nlp_model is None
+
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+
+        with (
+            patch.object(
+                summarise_agent._model_cache,
+                "get_spacy_model",
+                AsyncMock(return_value=nlp),
+            ) as mock_load,
+            patch.object(summarise_agent, "_summarize_with_gemini", return_value=None),
+        ):
+            await summarise_agent._summarize_content_chunks(
+                ["First point. Second point."]
+            )
+            assert summarise_agent._nlp_model is nlp
+
+            await summarise_agent._summarize_content_chunks(
+                ["Third point. Fourth point."]
+            )
+
+        mock_load.assert_awaited_once_with(
+            model_name="en_core_web_sm", fallback_to_blank=True
+        )
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_summarize_content_chunks_ai_failure_extractive_fallback(
+        self, summarise_agent
+    ):
         """Test fallback to extractive summarization when AI fails."""
         chunks = ["This is test content that needs summarization."]
 
         with (
-            patch.object(agent, "_summarize_with_gemini", return_value=None),
+            patch.object(summarise_agent, "_summarize_with_gemini", return_value=None),
+            patch.object(
+                summarise_agent, "_ensure_spacy_model", new_callable=AsyncMock
+            ),
             patch.object(
-                agent, "_extractive_summarization", return_value="Extractive summary"
+                summarise_agent,
+                "_extractive_summarization",
+                return_value="Extractive summary",
             ),
         ):
-            result = await agent._summarize_content_chunks(chunks)
+            result = await summarise_agent._summarize_content_chunks(chunks)
 
         assert result == "Extractive summary"
 
-    @pytest.mark.asyncio
-    async def test_execute_skill_successful_summarization(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_concurrent_extractive_fallbacks_are_serialized(
+        self, summarise_agent
+    ):
+        """Test chunks falling back together never parse in parallel threads."""
+        chunks = [f"Chunk {i}." for i in range(5)]
+        counter_lock = threading.Lock()
+        in_flight = 0
+        peak_in_flight = 0
+
+        def extractive(content, max_sentences=3):
+            nonlocal in_flight, peak_in_flight
+            with counter_lock:
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+            # Hold the worker thread long enough for others to overlap
+            time.sleep(0.01)
+            with counter_lock:
+                in_flight -= 1
+            return f"Extract of {content}"
+
+        with (
+            patch.object(summarise_agent, "_summarize_with_gemini", return_value=None),
+            patch.object(
+                summarise_agent, "_ensure_spacy_model", new_callable=AsyncMock
+            ),
+            patch.object(
+                summarise_agent, "_extractive_summarization", side_effect=extractive
+            ) as mock_extractive,
+        ):
+            await summarise_agent._summarize_content_chunks(chunks)
+
+        # Every chunk plus the combined summary went through the fallback
+        assert mock_extractive.call_count == len(chunks) + 1
+        assert peak_in_flight == 1
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_execute_skill_successful_summarization(self, summarise_agent):
         """Test successful skill execution with summarization."""
         test_content = "This is test content for summarization testing."
 
         with patch.object(
-            agent, "_summarize_content_chunks", return_value="Test summary"
+            summarise_agent, "_summarize_content_chunks", return_value="Test summary"
         ):
-            result = await agent.execute_skill(
+            result = await summarise_agent.execute_skill(
                 "summarizeContent",
                 {"content": test_content, "content_type": "post", "max_length": 3},
             )
@@ -243,16 +592,18 @@ class TestSummariseAgent:
         assert result["summary_length"] == len("Test summary")
         assert result["chunks_processed"] == 1
 
-    @pytest.mark.asyncio
-    async def test_execute_skill_with_post_ids(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_execute_skill_with_post_ids(self, summarise_agent):
         """Test skill execution with post IDs for database tracking."""
         test_content = "Content with post IDs."
         post_ids = ["post1", "post2"]
 
         with patch.object(
-            agent, "_summarize_content_chunks", return_value="Summary with IDs"
+            summarise_agent,
+            "_summarize_content_chunks",
+            return_value="Summary with IDs",
         ):
-            result = await agent.execute_skill(
+            result = await summarise_agent.execute_skill(
                 "summarizeContent", {"content": test_content, "post_ids": post_ids}
             )
 
@@ -261,21 +612,25 @@ class TestSummariseAgent:
         # Database storage is not yet implemented, so summary_id should be None
         assert result["summary_id"] is None
 
-    @pytest.mark.asyncio
-    async def test_execute_skill_content_chunking(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_execute_skill_content_chunking(self, summarise_agent):
         """Test skill execution with content that requires chunking."""
         # Create large content that will be chunked
         large_content = "This is a sentence. " * 1000
 
         with (
             patch.object(
-                agent, "_split_content_recursively", return_value=["chunk1", "chunk2"]
+                summarise_agent,
+                "_split_content_recursively",
+                return_value=["chunk1", "chunk2"],
             ) as mock_split,
             patch.object(
-                agent, "_summarize_content_chunks", return_value="Chunked summary"
+                summarise_agent,
+                "_summarize_content_chunks",
+                return_value="Chunked summary",
             ),
         ):
-            result = await agent.execute_skill(
+            result = await summarise_agent.execute_skill(
                 "summarizeContent", {"content": large_content}
             )
 
@@ -284,13 +639,19 @@ class TestSummariseAgent:
         assert result["chunks_processed"] == 2
         mock_split.assert_called_once_with(large_content)
 
-    def test_get_health_status(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_get_health_status(self, summarise_agent):
         """Test agent health status reporting."""
+        # A bare object() is enough: the health check must only test the model
+        # for presence, never call into it
         with (
-            patch.object(agent, "_gemini_initialized", True),
-            patch.object(agent, "_nlp_model", MagicMock()),
+            patch.object(summarise_agent, "_gemini_initialized", True),
+            patch.object(summarise_agent, "_nlp_model", object()),
+            patch.object(
+                summarise_agent, "_summarize_with_gemini", AsyncMock(return_value="ok")
+            ),
         ):
-            status = agent.get_health_status()
+            status = await summarise_agent.get_health_status()
 
         assert "status" in status
         assert "gemini_initialized" in status
@@ -303,13 +664,15 @@ class TestSummariseAgent:
         assert status["gemini_initialized"] is True
         assert status["spacy_available"] is True
 
-    @pytest.mark.asyncio
-    async def test_error_handling_in_skill_execution(self, agent):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_error_handling_in_skill_execution(self, summarise_agent):
         """Test error handling during skill execution."""
         with patch.object(
-            agent, "_summarize_content_chunks", side_effect=Exception("Test error")
+            summarise_agent,
+            "_summarize_content_chunks",
+            side_effect=Exception("Test error"),
         ):
-            result = await agent.execute_skill(
+            result = await summarise_agent.execute_skill(
                 "summarizeContent", {"content": "Test content"}
             )
 
@@ -336,3 +699,28 @@ class TestRateLimitState:
         assert state.requests_made == 0
         assert state.window_start == 0.0
         assert state.max_requests_per_minute == 100
+        assert state.time_fn is time.monotonic
+
+    def test_rate_limit_state_custom_clock(self):
+        """Test RateLimitState accepts an injected clock."""
+        clock = FakeClock([1.0, 2.0])
+        state = RateLimitState(time_fn=clock)
+
+        assert state.time_fn() == 1.0
+        assert state.time_fn() == 2.0
+        assert clock.calls == 2
+
+    def test_rate_limit_state_ignores_clock_in_repr_and_eq(self):
+        """Test the injected clock is left out of repr and equality."""
+        state = RateLimitState(time_fn=FakeClock([1.0]))
+
+        assert state == RateLimitState()
+        assert "time_fn" not in repr(state)
+
+    def test_rate_limit_state_uses_slots(self):
+        """Test RateLimitState stores fields in slots rather than a __dict__."""
+        state = RateLimitState()
+
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unexpected_field = 1
@@ -0,0 +1,15 @@
+# ABOUTME: Micro-benchmarks for SummariseAgent hot paths using pytest-benchmark
+# ABOUTME: Skipped by default (see pytest addopts); run with `pytest --benchmark-only`
+
+import pytest
+
+
+@pytest.mark.benchmark(group="chunking")
+def test_bench_split_recursively(summarise_agent, benchmark):
+    """Benchmark recursive chunking of a ~100KB multi-paragraph document."""
+    content = ("This is a sentence. " * 500 + "\n\n") * 10
+
+    chunks = benchmark(summarise_agent._split_content_recursively, content, 1000)
+
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert "".join(chunks) == content
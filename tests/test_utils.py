@@ -1,6 +1,9 @@
 # ABOUTME: Test utilities providing real implementations instead of mocks
 # ABOUTME: Implements test doubles that follow A2A protocol specifications
 
+from collections.abc import Iterable
+from itertools import count
+from operator import itemgetter
 from typing import Any
 
 from reddit_watcher.a2a_protocol import EventQueue, RequestContext
@@ -9,17 +12,36 @@ from reddit_watcher.a2a_protocol import EventQueue, RequestContext
 class FakeEventQueue(EventQueue):
     """Fake implementation of EventQueue with inspection capabilities."""
 
+    _get_content = staticmethod(itemgetter("content"))
+
     def __init__(self):
         super().__init__()
         self.enqueue_event_called = False
-        self.enqueue_event_call_count = 0
+        self._call_counter = count(1)
+        self._call_count = 0
+        # Stringified content of enqueued dict events, for substring assertions
+        self._content_index: list[str] = []
 
     async def enqueue_event(self, event: Any) -> None:
         """Track enqueue_event calls."""
         self.enqueue_event_called = True
-        self.enqueue_event_call_count += 1
+        # Take the next count before awaiting so concurrent producers never
+        # read-modify-write a shared attribute across a task switch
+        self._call_count = next(self._call_counter)
+        if isinstance(event, dict):
+            try:
+                content = self._get_content(event)
+            except KeyError:
+                pass
+            else:
+                self._content_index.append(str(content))
         await super().enqueue_event(event)
 
+    @property
+    def enqueue_event_call_count(self) -> int:
+        """Number of enqueue_event calls since creation or the last reset."""
+        return self._call_count
+
     def assert_event_enqueued(self, expected_content: str | None = None) -> None:
         """Assert that an event was enqueued."""
         assert self.enqueue_event_called, "enqueue_event was not called"
@@ -28,22 +50,24 @@ class FakeEventQueue(EventQueue):
             events = self.get_events()
             assert len(events) > 0, "No events in queue"
 
-            # Check if any event contains the expected content
-            found = False
-            for event in events:
-                if isinstance(event, dict):
-                    content = event.get("content", "")
-                    if expected_content in str(content):
-                        found = True
-                        break
+            # Single substring search over all event contents; the NUL separator
+            # keeps matches from spanning two events
+            haystack = "\x00".join(self._content_index)
+            assert expected_content in haystack, (
+                f"Expected content '{expected_content}' not found in events"
+            )
 
-            assert found, f"Expected content '{expected_content}' not found in events"
+    def clear(self) -> None:
+        """Clear all events along with their indexed content."""
+        super().clear()
+        self._content_index.clear()
 
     def reset(self) -> None:
         """Reset test state."""
         self.clear()
         self.enqueue_event_called = False
-        self.enqueue_event_call_count = 0
+        self._call_counter = count(1)
+        self._call_count = 0
 
 
 class FakeRequestContext(RequestContext):
@@ -74,6 +98,18 @@ def create_test_event_queue() -> FakeEventQueue:
     return FakeEventQueue()
 
 
+class FakeClock:
+    """Deterministic clock returning successive readings on each call."""
+
+    def __init__(self, readings: Iterable[float]):
+        self._readings = iter(readings)
+        self.calls = 0
+
+    def __call__(self) -> float:
+        self.calls += 1
+        return next(self._readings)
+
+
 class AsyncContextManager:
     """Simple async context manager for testing."""
 
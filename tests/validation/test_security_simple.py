@@ -2,15 +2,18 @@
 # ABOUTME: Tests authentication, rate limiting, security headers, and input validation without external dependencies
 
 import asyncio
-import json
 import logging
-import os
 import time
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
 
 import aiohttp
+import orjson
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from reddit_watcher.auth_middleware import AuthMiddleware
 from reddit_watcher.config import Settings
@@ -23,6 +26,58 @@ logger = logging.getLogger(__name__)
 TEST_API_KEY = "test-security-simple-key-xyz789"
 INVALID_API_KEY = "invalid-key-should-fail-abc123"
 TEST_PORT = 8099
+BASE_URL = f"http://127.0.0.1:{TEST_PORT}"
+TOKEN_CACHE_TTL_SECONDS = 60.0
+HEALTH_PATH = "/health"
+# Shared by every probe; connecting to localhost should never take long
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=5, sock_connect=1, sock_read=4)
+
+# Constant response bodies, encoded once at import
+_AGENT_CARD_BYTES = orjson.dumps(
+    {
+        "name": "Security Test Agent",
+        "version": "1.0.0",
+        "type": "test",
+        "skills": ["health_check"],
+    }
+)
+_DISCOVER_BYTES = orjson.dumps({"agents": []})
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+
+# Request body and headers reused by every probe of the protected endpoint
+_TEST_BODY = orjson.dumps({"test": "data"})
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_VALID_AUTH = {**_JSON_HEADERS, "Authorization": f"Bearer {TEST_API_KEY}"}
+_INVALID_AUTH = {**_JSON_HEADERS, "Authorization": f"Bearer {INVALID_API_KEY}"}
+
+# Shared Settings for every test server, created on first use
+_settings: Settings | None = None
+
+
+def _get_test_settings() -> Settings:
+    """Get the Settings shared by test servers, configured with TEST_API_KEY.
+
+    The key is passed as an init argument, which pydantic-settings prefers
+    over the environment, so the process environment is left untouched.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings(a2a_api_key=TEST_API_KEY)
+    return _settings
+
+
+class HealthCheckBypass:
+    """ASGI wrapper that skips a middleware for health check requests."""
+
+    def __init__(self, app: ASGIApp, middleware_cls: type, **options: Any):
+        self.app = app
+        self.middleware = middleware_cls(app, **options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == HEALTH_PATH:
+            await self.app(scope, receive, send)
+        else:
+            await self.middleware(scope, receive, send)
 
 
 class SimpleTestServer:
@@ -30,23 +85,48 @@ class SimpleTestServer:
 
     def __init__(self, port: int = TEST_PORT):
         self.port = port
-        # Set environment variable first
-        os.environ["A2A_API_KEY"] = TEST_API_KEY
-        self.config = Settings()
-        # Also set manually to ensure it's set
-        self.config.a2a_api_key = TEST_API_KEY
+        self.config = _get_test_settings()
         self.auth = AuthMiddleware(self.config)
         self.security = HTTPBearer()
+        # Verified bearer tokens -> (expiry on the monotonic clock, subject)
+        self._token_cache: dict[str, tuple[float, str]] = {}
 
-        # Debug print
-        print(f"DEBUG: Server config a2a_api_key = '{self.config.a2a_api_key}'")
-        print(f"DEBUG: Expected API key = '{TEST_API_KEY}'")
-        print(f"DEBUG: Keys match = {self.config.a2a_api_key == TEST_API_KEY}")
+        logger.debug("Server config a2a_api_key = '%s'", self.config.a2a_api_key)
+        logger.debug("Expected API key = '%s'", TEST_API_KEY)
+        logger.debug("Keys match = %s", self.config.a2a_api_key == TEST_API_KEY)
         self.app = None
+        self.server: uvicorn.Server | None = None
+
+    async def verify_token(self, credentials: HTTPAuthorizationCredentials) -> str:
+        """Verify a bearer token, reusing recent successful verifications.
+
+        Only successful verifications are cached; rejected tokens always go
+        through AuthMiddleware so failures are never masked.
+
+        Args:
+            credentials: HTTP authorization credentials from request header
+
+        Returns:
+            Authentication subject identifier
+
+        Raises:
+            HTTPException: If authentication fails
+        """
+        token = credentials.credentials
+        now = time.monotonic()
+        cached = self._token_cache.get(token)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        user = await self.auth.verify_token(credentials)
+        self._token_cache[token] = (now + TOKEN_CACHE_TTL_SECONDS, user)
+        return user
 
     def create_app(self) -> FastAPI:
         """Create test FastAPI application."""
-        app = FastAPI(title="Security Test Server")
+        app = FastAPI(
+            title="Security Test Server", default_response_class=ORJSONResponse
+        )
 
         # Add security middleware
         from reddit_watcher.security_middleware import (
@@ -58,29 +138,34 @@ class SimpleTestServer:
 
         app.add_middleware(SecurityHeadersMiddleware, config=self.config)
         app.add_middleware(RateLimitingMiddleware, config=self.config)
-        app.add_middleware(InputValidationMiddleware, config=self.config)
-        app.add_middleware(SecurityAuditMiddleware, config=self.config)
+        # /health carries no input worth validating or auditing, but it still
+        # gets security and rate limit headers, which the probes check
+        app.add_middleware(
+            HealthCheckBypass,
+            middleware_cls=InputValidationMiddleware,
+            config=self.config,
+        )
+        app.add_middleware(
+            HealthCheckBypass,
+            middleware_cls=SecurityAuditMiddleware,
+            config=self.config,
+        )
 
         # Public endpoints (no auth required)
-        @app.get("/health")
+        @app.api_route(HEALTH_PATH, methods=["GET", "HEAD"])
         async def health_check():
             """Health check endpoint."""
-            return {"status": "healthy", "timestamp": time.time()}
+            return Response(_HEALTH_BYTES, media_type="application/json")
 
         @app.get("/.well-known/agent.json")
         async def agent_card():
             """Agent card endpoint."""
-            return {
-                "name": "Security Test Agent",
-                "version": "1.0.0",
-                "type": "test",
-                "skills": ["health_check"],
-            }
+            return Response(_AGENT_CARD_BYTES, media_type="application/json")
 
         @app.get("/discover")
         async def discover():
             """Service discovery endpoint."""
-            return {"agents": []}
+            return Response(_DISCOVER_BYTES, media_type="application/json")
 
         # Protected endpoints (auth required)
         @app.post("/skills/test")
@@ -90,16 +175,12 @@ class SimpleTestServer:
         ):
             """Test skill endpoint requiring authentication."""
             # Verify the token using our auth middleware
-            try:
-                user = await self.auth.verify_token(credentials)
-                return {
-                    "message": "Authenticated request successful",
-                    "user": user,
-                    "request": request,
-                }
-            except HTTPException as e:
-                # Re-raise the HTTP exception
-                raise e
+            user = await self.verify_token(credentials)
+            return {
+                "message": "Authenticated request successful",
+                "user": user,
+                "request": request,
+            }
 
         @app.post("/a2a")
         async def a2a_endpoint(request: dict):
@@ -113,252 +194,254 @@ class SimpleTestServer:
         self.app = app
         return app
 
-    async def start_server(self):
-        """Start the test server."""
+    def build_server(self) -> uvicorn.Server:
+        """Build the uvicorn server for the test application."""
         app = self.create_app()
 
+        # httptools replaces the pure-Python h11 parser; lifespan and websockets
+        # are unused here so skip their setup. The event loop is picked by the
+        # caller, since uvicorn only applies Config(loop=...) when it owns it
         config = uvicorn.Config(
-            app, host="127.0.0.1", port=self.port, log_level="info", access_log=False
+            app,
+            host="127.0.0.1",
+            port=self.port,
+            # Readiness comes from _wait_ready, not from scraping startup logs
+            log_level="warning",
+            access_log=False,
+            use_colors=False,
+            http="httptools",
+            lifespan="off",
+            ws="none",
+            interface="asgi3",
         )
 
-        server = uvicorn.Server(config)
+        self.server = uvicorn.Server(config)
+        return self.server
+
+    async def serve(self):
+        """Serve the test application until ``self.server.should_exit`` is set."""
+        server = self.server or self.build_server()
         await server.serve()
 
 
-async def run_security_tests():
-    """Run security tests against the test server."""
-    base_url = f"http://127.0.0.1:{TEST_PORT}"
-
-    async with aiohttp.ClientSession() as session:
-        results = {
-            "timestamp": time.time(),
-            "base_url": base_url,
-            "tests": [],
-            "passed": 0,
-            "failed": 0,
+async def _test_public_health(session: aiohttp.ClientSession) -> dict:
+    """Public endpoints should be accessible."""
+    async with session.get(f"{BASE_URL}{HEALTH_PATH}") as response:
+        if response.status == 200:
+            return {
+                "test": "public_endpoint_health",
+                "status": "PASS",
+                "message": "Health endpoint accessible",
+            }
+        return {
+            "test": "public_endpoint_health",
+            "status": "FAIL",
+            "message": f"Health endpoint returned {response.status}",
         }
 
-        # Test 1: Public endpoints should be accessible
-        try:
-            async with session.get(f"{base_url}/health", timeout=5) as response:
-                if response.status == 200:
-                    results["tests"].append(
-                        {
-                            "test": "public_endpoint_health",
-                            "status": "PASS",
-                            "message": "Health endpoint accessible",
-                        }
-                    )
-                    results["passed"] += 1
-                else:
-                    results["tests"].append(
-                        {
-                            "test": "public_endpoint_health",
-                            "status": "FAIL",
-                            "message": f"Health endpoint returned {response.status}",
-                        }
-                    )
-                    results["failed"] += 1
-        except Exception as e:
-            results["tests"].append(
-                {
-                    "test": "public_endpoint_health",
-                    "status": "ERROR",
-                    "message": f"Health endpoint error: {str(e)}",
-                }
-            )
-            results["failed"] += 1
 
-        # Test 2: Protected endpoint should require authentication
-        try:
-            async with session.post(
-                f"{base_url}/skills/test", json={"test": "data"}, timeout=5
-            ) as response:
-                if response.status == 401:
-                    results["tests"].append(
-                        {
-                            "test": "auth_required_endpoint",
-                            "status": "PASS",
-                            "message": "Protected endpoint properly requires auth (401)",
-                        }
-                    )
-                    results["passed"] += 1
-                else:
-                    results["tests"].append(
-                        {
-                            "test": "auth_required_endpoint",
-                            "status": "FAIL",
-                            "message": f"Protected endpoint returned {response.status} instead of 401",
-                        }
-                    )
-                    results["failed"] += 1
-        except Exception as e:
-            results["tests"].append(
-                {
-                    "test": "auth_required_endpoint",
-                    "status": "ERROR",
-                    "message": f"Auth test error: {str(e)}",
-                }
-            )
-            results["failed"] += 1
+async def _test_auth_required(session: aiohttp.ClientSession) -> dict:
+    """Protected endpoint should require authentication."""
+    async with session.post(
+        f"{BASE_URL}/skills/test", data=_TEST_BODY, headers=_JSON_HEADERS
+    ) as response:
+        if response.status == 401:
+            return {
+                "test": "auth_required_endpoint",
+                "status": "PASS",
+                "message": "Protected endpoint properly requires auth (401)",
+            }
+        return {
+            "test": "auth_required_endpoint",
+            "status": "FAIL",
+            "message": f"Protected endpoint returned {response.status} instead of 401",
+        }
 
-        # Test 3: Valid API key should work
-        try:
-            headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
-            print(f"DEBUG: Sending request with header: {headers}")
-            async with session.post(
-                f"{base_url}/skills/test",
-                json={"test": "data"},
-                headers=headers,
-                timeout=5,
-            ) as response:
-                response_text = await response.text()
-                print(
-                    f"DEBUG: Valid API key test - Status: {response.status}, Response: {response_text}"
-                )
-                if response.status == 200:
-                    results["tests"].append(
-                        {
-                            "test": "valid_api_key",
-                            "status": "PASS",
-                            "message": "Valid API key accepted",
-                        }
-                    )
-                    results["passed"] += 1
-                else:
-                    results["tests"].append(
-                        {
-                            "test": "valid_api_key",
-                            "status": "FAIL",
-                            "message": f"Valid API key returned {response.status} - {response_text}",
-                        }
-                    )
-                    results["failed"] += 1
-        except Exception as e:
-            results["tests"].append(
-                {
-                    "test": "valid_api_key",
-                    "status": "ERROR",
-                    "message": f"Valid API key test error: {str(e)}",
-                }
-            )
-            results["failed"] += 1
 
-        # Test 4: Invalid API key should be rejected
-        try:
-            headers = {"Authorization": f"Bearer {INVALID_API_KEY}"}
-            async with session.post(
-                f"{base_url}/skills/test",
-                json={"test": "data"},
-                headers=headers,
-                timeout=5,
-            ) as response:
-                if response.status == 403:
-                    results["tests"].append(
-                        {
-                            "test": "invalid_api_key",
-                            "status": "PASS",
-                            "message": "Invalid API key properly rejected (403)",
-                        }
-                    )
-                    results["passed"] += 1
-                else:
-                    results["tests"].append(
-                        {
-                            "test": "invalid_api_key",
-                            "status": "FAIL",
-                            "message": f"Invalid API key returned {response.status} instead of 403",
-                        }
-                    )
-                    results["failed"] += 1
-        except Exception as e:
-            results["tests"].append(
-                {
-                    "test": "invalid_api_key",
-                    "status": "ERROR",
-                    "message": f"Invalid API key test error: {str(e)}",
-                }
-            )
-            results["failed"] += 1
+async def _test_valid_api_key(session: aiohttp.ClientSession) -> dict:
+    """Valid API key should work."""
+    logger.debug("Sending request with header: %s", _VALID_AUTH)
+    async with session.post(
+        f"{BASE_URL}/skills/test", data=_TEST_BODY, headers=_VALID_AUTH
+    ) as response:
+        response_text = await response.text()
+        logger.debug(
+            "Valid API key test - Status: %s, Response: %s",
+            response.status,
+            response_text,
+        )
+        if response.status == 200:
+            return {
+                "test": "valid_api_key",
+                "status": "PASS",
+                "message": "Valid API key accepted",
+            }
+        return {
+            "test": "valid_api_key",
+            "status": "FAIL",
+            "message": f"Valid API key returned {response.status} - {response_text}",
+        }
+
+
+async def _test_invalid_api_key(session: aiohttp.ClientSession) -> dict:
+    """Invalid API key should be rejected."""
+    async with session.post(
+        f"{BASE_URL}/skills/test", data=_TEST_BODY, headers=_INVALID_AUTH
+    ) as response:
+        if response.status == 403:
+            return {
+                "test": "invalid_api_key",
+                "status": "PASS",
+                "message": "Invalid API key properly rejected (403)",
+            }
+        return {
+            "test": "invalid_api_key",
+            "status": "FAIL",
+            "message": f"Invalid API key returned {response.status} instead of 403",
+        }
+
+
+def _check_security_headers(headers: Mapping[str, str]) -> dict:
+    """Security headers should be present."""
+    expected_headers = [
+        "X-Content-Type-Options",
+        "X-Frame-Options",
+        "X-XSS-Protection",
+        "Content-Security-Policy",
+    ]
+
+    present_headers = [h for h in expected_headers if h in headers]
+
+    if len(present_headers) >= 3:
+        return {
+            "test": "security_headers",
+            "status": "PASS",
+            "message": f"Security headers present: {present_headers}",
+        }
+    return {
+        "test": "security_headers",
+        "status": "FAIL",
+        "message": f"Insufficient security headers: {present_headers}",
+    }
+
+
+def _check_rate_limit_headers(headers: Mapping[str, str]) -> dict:
+    """Rate limiting headers should be present."""
+    rate_limit_headers = ["X-RateLimit-Limit", "X-RateLimit-Remaining"]
+
+    present_headers = [h for h in rate_limit_headers if h in headers]
+
+    if len(present_headers) >= 1:
+        return {
+            "test": "rate_limit_headers",
+            "status": "PASS",
+            "message": f"Rate limit headers present: {present_headers}",
+        }
+    # Not a failure since it might be intentional
+    return {
+        "test": "rate_limit_headers",
+        "status": "INFO",
+        "message": "No rate limit headers found (may be by design)",
+    }
+
+
+async def _probe_headers(session: aiohttp.ClientSession) -> tuple[dict, dict]:
+    """Check security and rate limit headers from a single /health response."""
+    async with session.get(f"{BASE_URL}{HEALTH_PATH}") as response:
+        return (
+            _check_security_headers(response.headers),
+            _check_rate_limit_headers(response.headers),
+        )
 
-        # Test 5: Security headers should be present
-        try:
-            async with session.get(f"{base_url}/health", timeout=5) as response:
-                expected_headers = [
-                    "X-Content-Type-Options",
-                    "X-Frame-Options",
-                    "X-XSS-Protection",
-                    "Content-Security-Policy",
-                ]
-
-                present_headers = [h for h in expected_headers if h in response.headers]
-
-                if len(present_headers) >= 3:
-                    results["tests"].append(
-                        {
-                            "test": "security_headers",
-                            "status": "PASS",
-                            "message": f"Security headers present: {present_headers}",
-                        }
-                    )
-                    results["passed"] += 1
-                else:
-                    results["tests"].append(
-                        {
-                            "test": "security_headers",
-                            "status": "FAIL",
-                            "message": f"Insufficient security headers: {present_headers}",
-                        }
-                    )
-                    results["failed"] += 1
-        except Exception as e:
-            results["tests"].append(
-                {
-                    "test": "security_headers",
-                    "status": "ERROR",
-                    "message": f"Security headers test error: {str(e)}",
-                }
-            )
-            results["failed"] += 1
 
-        # Test 6: Rate limiting headers should be present
+async def _run(
+    names: tuple[str, ...],
+    probe: Callable[[aiohttp.ClientSession], Awaitable[dict | tuple[dict, ...]]],
+    session: aiohttp.ClientSession,
+) -> list[dict]:
+    """Run one probe, reporting an ERROR result per test name if it raises.
+
+    Args:
+        names: Names of the test results the probe reports
+        probe: Probe coroutine function returning one or more result dicts
+        session: Shared client session
+
+    Returns:
+        The probe's result dicts, in order
+    """
+    try:
+        returned = await probe(session)
+    except Exception as e:
+        return [
+            {"test": name, "status": "ERROR", "message": f"{name} error: {str(e)}"}
+            for name in names
+        ]
+    return list(returned) if isinstance(returned, tuple) else [returned]
+
+
+async def _wait_ready(port: int, deadline: float = 5.0) -> None:
+    """Wait until the test server accepts TCP connections on ``port``.
+
+    Args:
+        port: Port the test server listens on
+        deadline: Maximum number of seconds to wait
+
+    Raises:
+        TimeoutError: If the server is not accepting connections in time
+    """
+    give_up_at = time.monotonic() + deadline
+    delay = 0.01
+    while True:
         try:
-            async with session.get(f"{base_url}/health", timeout=5) as response:
-                rate_limit_headers = ["X-RateLimit-Limit", "X-RateLimit-Remaining"]
-
-                present_headers = [
-                    h for h in rate_limit_headers if h in response.headers
-                ]
-
-                if len(present_headers) >= 1:
-                    results["tests"].append(
-                        {
-                            "test": "rate_limit_headers",
-                            "status": "PASS",
-                            "message": f"Rate limit headers present: {present_headers}",
-                        }
-                    )
-                    results["passed"] += 1
-                else:
-                    results["tests"].append(
-                        {
-                            "test": "rate_limit_headers",
-                            "status": "INFO",
-                            "message": "No rate limit headers found (may be by design)",
-                        }
-                    )
-                    # Don't count as failed since it might be intentional
-        except Exception as e:
-            results["tests"].append(
-                {
-                    "test": "rate_limit_headers",
-                    "status": "ERROR",
-                    "message": f"Rate limit headers test error: {str(e)}",
-                }
-            )
-            results["failed"] += 1
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if time.monotonic() >= give_up_at:
+                raise TimeoutError(
+                    f"Test server not ready on port {port} after {deadline}s"
+                ) from None
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
 
-        return results
+
+# (names of the results a probe reports, probe)
+SECURITY_TESTS = (
+    (("public_endpoint_health",), _test_public_health),
+    (("auth_required_endpoint",), _test_auth_required),
+    (("valid_api_key",), _test_valid_api_key),
+    (("invalid_api_key",), _test_invalid_api_key),
+    (("security_headers", "rate_limit_headers"), _probe_headers),
+)
+
+
+async def run_security_tests():
+    """Run security tests against the test server."""
+    # One connection per probe so the independent tests run in parallel
+    connector = aiohttp.TCPConnector(
+        limit=len(SECURITY_TESTS), ttl_dns_cache=300, force_close=False
+    )
+
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=DEFAULT_TIMEOUT
+    ) as session:
+        timestamp = time.time()
+        gathered = await asyncio.gather(
+            *(_run(names, probe, session) for names, probe in SECURITY_TESTS)
+        )
+
+    tests = [test_result for group in gathered for test_result in group]
+
+    # INFO results are informational and count as neither passed nor failed
+    return {
+        "timestamp": timestamp,
+        "base_url": BASE_URL,
+        "tests": tests,
+        "passed": sum(test["status"] == "PASS" for test in tests),
+        "failed": sum(test["status"] in ("FAIL", "ERROR") for test in tests),
+    }
 
 
 async def main():
@@ -369,15 +452,20 @@ async def main():
 
     # Start test server in background
     server = SimpleTestServer()
-    server_task = asyncio.create_task(server.start_server())
-
-    # Wait for server to start
-    await asyncio.sleep(2)
+    uvicorn_server = server.build_server()
+    server_task = asyncio.create_task(server.serve())
 
     try:
+        # Wait for server to start
+        await _wait_ready(server.port)
+
         # Run security tests
         logger.info("Running security tests...")
+        # Wall-clock time is only for the report timestamp; durations use the
+        # monotonic clock
+        start_ns = time.monotonic_ns()
         results = await run_security_tests()
+        results["duration_ms"] = (time.monotonic_ns() - start_ns) / 1e6
 
         # Print results
         print("\n" + "=" * 60)
@@ -406,6 +494,7 @@ async def main():
         print(f"Passed: {results['passed']}")
         print(f"Failed: {results['failed']}")
         print(f"Success Rate: {success_rate:.1f}%")
+        print(f"Duration: {results['duration_ms']:.1f} ms")
 
         if success_rate >= 80:
             print("Overall Status: ✓ SECURE")
@@ -417,20 +506,25 @@ async def main():
         # Save results
         with open(
             "/home/jyx/git/agentic-technical-watch/simple_security_test_report.json",
-            "w",
+            "wb",
         ) as f:
-            json.dump(results, f, indent=2)
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
         print("\nDetailed results saved to: simple_security_test_report.json")
 
     finally:
-        # Stop server
-        server_task.cancel()
-        try:
-            await server_task
-        except asyncio.CancelledError:
-            pass
+        # Ask uvicorn to shut down so it closes its listener cleanly
+        uvicorn_server.should_exit = True
+        await server_task
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Run the in-process server on uvloop where available; it has no Windows
+    # support, so fall back to the default event loop there
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    asyncio.run(main(), loop_factory=loop_factory)
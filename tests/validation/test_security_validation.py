@@ -2,12 +2,17 @@
 # ABOUTME: Validates authentication, authorization, rate limiting, input validation, and security headers
 
 import asyncio
-import json
 import logging
 import os
+import sys
 import time
+from collections.abc import AsyncIterator, Container
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from urllib.parse import quote
 
 import aiohttp
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,6 +22,103 @@ logger = logging.getLogger(__name__)
 TEST_API_KEY = "test-security-validation-key-abc123"
 INVALID_API_KEY = "invalid-key-should-fail-xyz789"
 TEST_BASE_URL = "http://localhost:8000"
+OVERSIZED_PAYLOAD_SIZE = 11 * 1024 * 1024  # Above the 10MB request limit
+OVERSIZED_PAYLOAD_CHUNK = b"x" * 65536
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=2, sock_read=8)
+OVERSIZED_TIMEOUT = aiohttp.ClientTimeout(total=30)
+WARMUP_TIMEOUT = aiohttp.ClientTimeout(total=2)
+
+# The finite domain of per-test result statuses
+_PASS = "PASS"
+_FAIL = "FAIL"
+_INFO = "INFO"
+_ERROR = "ERROR"
+_STATUS_SYMBOL = {_PASS: "✓", _FAIL: "✗", _INFO: "ℹ", _ERROR: "💥"}
+
+# (max failed tests, min score, overall status), best tier first
+_STATUS_TIERS = (
+    (0, 90.0, "EXCELLENT"),
+    (1, 80.0, "GOOD"),
+    (3, 60.0, "ACCEPTABLE"),
+)
+
+# Request fragments shared by every auth probe
+_EMPTY_PARAMS_BYTES = orjson.dumps({"parameters": {}})
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_VALID_AUTH = {**_JSON_HEADERS, "Authorization": f"Bearer {TEST_API_KEY}"}
+_INVALID_AUTH = {**_JSON_HEADERS, "Authorization": f"Bearer {INVALID_API_KEY}"}
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Outcome of a single security probe."""
+
+    test: str
+    status: str
+    message: str
+    missing: list[str] | None = None
+
+
+@dataclass(slots=True)
+class SuiteResult:
+    """Probe results and pass/fail tallies for one validation suite."""
+
+    test_name: str
+    tests: list[ValidationResult] = field(default_factory=list)
+    passed: int = 0
+    failed: int = 0
+    # Display name, filled in by the runner that scheduled the suite
+    suite_name: str = ""
+
+
+@dataclass(slots=True)
+class SuiteError:
+    """A validation suite that raised before producing results."""
+
+    suite_name: str
+    error: str
+
+
+@dataclass(slots=True)
+class ValidationReport:
+    """Suite results and summary of one comprehensive validation run."""
+
+    timestamp: float
+    base_url: str
+    test_suites: list[SuiteResult | SuiteError] = field(default_factory=list)
+    summary: dict[str, Any] = field(default_factory=dict)
+
+
+def _without_unset_fields(items: list[tuple[str, Any]]) -> dict[str, Any]:
+    """Build report dicts that leave out a probe's ``missing`` list when unset."""
+    return {key: value for key, value in items if value is not None}
+
+
+def _suite_to_dict(suite: SuiteResult | SuiteError) -> dict[str, Any]:
+    """Convert a suite outcome to the dict shape used in the JSON report."""
+    if isinstance(suite, SuiteError):
+        # A crashed suite is reported as one failed test with no results
+        return {**asdict(suite), "passed": 0, "failed": 1, "tests": []}
+    return asdict(suite, dict_factory=_without_unset_fields)
+
+
+def _report_to_dict(report: ValidationReport) -> dict[str, Any]:
+    """Convert a validation report to plain dicts for serialization."""
+    return {
+        "timestamp": report.timestamp,
+        "base_url": report.base_url,
+        "test_suites": [_suite_to_dict(suite) for suite in report.test_suites],
+        "summary": report.summary,
+    }
+
+
+async def _oversized_payload() -> AsyncIterator[bytes]:
+    """Yield OVERSIZED_PAYLOAD_SIZE bytes in fixed chunks without buffering them."""
+    sent = 0
+    while sent < OVERSIZED_PAYLOAD_SIZE:
+        chunk = OVERSIZED_PAYLOAD_CHUNK[: OVERSIZED_PAYLOAD_SIZE - sent]
+        yield chunk
+        sent += len(chunk)
 
 
 class SecurityValidator:
@@ -26,9 +128,68 @@ class SecurityValidator:
         self.base_url = base_url
         self.session = None
 
+        # Routes are fixed for the validator's lifetime, so build URLs once
+        self._health_url = f"{base_url}/health"
+        self._skill_url = f"{base_url}/skills/health_check"
+        self._public_urls = [
+            f"{base_url}{endpoint}"
+            for endpoint in ("/.well-known/agent.json", "/health", "/discover")
+        ]
+
+    @staticmethod
+    def _create_session(host_count: int = 1) -> aiohttp.ClientSession:
+        """Create a session whose connection pool serves every suite.
+
+        Args:
+            host_count: Number of base URLs sharing the pool; each gets
+                the same per-host connection budget
+
+        Returns:
+            Client session with no default Authorization header, since
+            several tests must send none
+        """
+        connector = aiohttp.TCPConnector(
+            limit=64 * host_count,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            force_close=False,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
+
+    @classmethod
+    async def validate_many(cls, base_urls: list[str]) -> list[ValidationReport]:
+        """Validate several deployments concurrently over one shared session.
+
+        Args:
+            base_urls: Base URLs of the deployments to validate
+
+        Returns:
+            Validation results for each base URL, in the given order
+        """
+        validators = [cls(base_url) for base_url in base_urls]
+        async with cls._create_session(len(validators)) as session:
+            for validator in validators:
+                validator.session = session
+            return await asyncio.gather(
+                *(validator.run_comprehensive_validation() for validator in validators)
+            )
+
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        self.session = self._create_session()
+
+        # Open a keep-alive connection up front so the first probe doesn't
+        # pay for connection setup; an unreachable server is reported by the
+        # suites themselves
+        try:
+            async with self.session.head(
+                self._health_url, timeout=WARMUP_TIMEOUT
+            ) as response:
+                await response.read()
+        except (aiohttp.ClientError, TimeoutError) as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -36,237 +197,234 @@ class SecurityValidator:
         if self.session:
             await self.session.close()
 
-    async def validate_authentication_security(self) -> dict:
+    def _record(self, results: SuiteResult, test_result: ValidationResult) -> None:
+        """Add a test result to its suite; anything but PASS counts as failed."""
+        results.tests.append(test_result)
+        if test_result.status == _PASS:
+            results.passed += 1
+        else:
+            results.failed += 1
+
+    async def _get_status(self, url: str) -> int:
+        """GET a URL and return only the response status."""
+        async with self.session.get(url) as response:
+            return response.status
+
+    async def _first_unexpected_status(
+        self, urls: list[str], expected_statuses: Container[int]
+    ) -> tuple[str, int] | None:
+        """GET URLs concurrently, stopping at the first unexpected status.
+
+        Args:
+            urls: URLs to probe
+            expected_statuses: Statuses that let the remaining probes continue
+
+        Returns:
+            The URL and status of the first probe to finish with an unexpected
+            status, or None if every probe got an expected one
+
+        Raises:
+            Exception: The first transport error, after cancelling the rest
+        """
+        pending = {asyncio.create_task(self._get_status(url)): url for url in urls}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    url = pending.pop(task)
+                    status = task.result()
+                    if status not in expected_statuses:
+                        return url, status
+            return None
+        finally:
+            # Release connector slots held by probes that no longer matter
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def validate_authentication_security(self) -> SuiteResult:
         """Validate authentication security measures."""
-        results = {
-            "test_name": "authentication_security",
-            "tests": [],
-            "passed": 0,
-            "failed": 0,
-        }
+        results = SuiteResult(test_name="authentication_security")
 
         # Test 1: Valid API key authentication
-        test_result = await self._test_valid_authentication()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_valid_authentication())
 
         # Test 2: Invalid API key rejection
-        test_result = await self._test_invalid_authentication()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_invalid_authentication())
 
         # Test 3: Missing authentication rejection
-        test_result = await self._test_missing_authentication()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_missing_authentication())
 
         # Test 4: Public endpoints accessibility
-        test_result = await self._test_public_endpoints()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_public_endpoints())
 
         return results
 
-    async def _test_valid_authentication(self) -> dict:
+    async def _test_valid_authentication(self) -> ValidationResult:
         """Test valid API key authentication."""
         try:
-            headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
             async with self.session.post(
-                f"{self.base_url}/skills/health_check",
-                json={"parameters": {}},
-                headers=headers,
-                timeout=10,
+                self._skill_url,
+                data=_EMPTY_PARAMS_BYTES,
+                headers=_VALID_AUTH,
             ) as response:
                 if response.status in [
                     200,
                     404,
                 ]:  # 404 means skill not found but auth worked
-                    return {
-                        "test": "valid_api_key_authentication",
-                        "status": "PASS",
-                        "message": f"Valid API key accepted (status: {response.status})",
-                    }
+                    return ValidationResult(
+                        test="valid_api_key_authentication",
+                        status=_PASS,
+                        message=f"Valid API key accepted (status: {response.status})",
+                    )
                 else:
-                    return {
-                        "test": "valid_api_key_authentication",
-                        "status": "FAIL",
-                        "message": f"Expected 200/404, got {response.status}",
-                    }
+                    return ValidationResult(
+                        test="valid_api_key_authentication",
+                        status=_FAIL,
+                        message=f"Expected 200/404, got {response.status}",
+                    )
         except Exception as e:
-            return {
-                "test": "valid_api_key_authentication",
-                "status": "ERROR",
-                "message": f"Test failed: {str(e)}",
-            }
+            return ValidationResult(
+                test="valid_api_key_authentication",
+                status=_ERROR,
+                message=f"Test failed: {str(e)}",
+            )
 
-    async def _test_invalid_authentication(self) -> dict:
+    async def _test_invalid_authentication(self) -> ValidationResult:
         """Test invalid API key rejection."""
         try:
-            headers = {"Authorization": f"Bearer {INVALID_API_KEY}"}
             async with self.session.post(
-                f"{self.base_url}/skills/health_check",
-                json={"parameters": {}},
-                headers=headers,
-                timeout=10,
+                self._skill_url,
+                data=_EMPTY_PARAMS_BYTES,
+                headers=_INVALID_AUTH,
             ) as response:
                 if response.status == 403:
-                    return {
-                        "test": "invalid_api_key_rejection",
-                        "status": "PASS",
-                        "message": "Invalid API key properly rejected (403)",
-                    }
+                    return ValidationResult(
+                        test="invalid_api_key_rejection",
+                        status=_PASS,
+                        message="Invalid API key properly rejected (403)",
+                    )
                 else:
-                    return {
-                        "test": "invalid_api_key_rejection",
-                        "status": "FAIL",
-                        "message": f"Expected 403, got {response.status}",
-                    }
+                    return ValidationResult(
+                        test="invalid_api_key_rejection",
+                        status=_FAIL,
+                        message=f"Expected 403, got {response.status}",
+                    )
         except Exception as e:
-            return {
-                "test": "invalid_api_key_rejection",
-                "status": "ERROR",
-                "message": f"Test failed: {str(e)}",
-            }
+            return ValidationResult(
+                test="invalid_api_key_rejection",
+                status=_ERROR,
+                message=f"Test failed: {str(e)}",
+            )
 
-    async def _test_missing_authentication(self) -> dict:
+    async def _test_missing_authentication(self) -> ValidationResult:
         """Test missing authentication rejection."""
         try:
             async with self.session.post(
-                f"{self.base_url}/skills/health_check",
-                json={"parameters": {}},
-                timeout=10,
+                self._skill_url,
+                data=_EMPTY_PARAMS_BYTES,
+                headers=_JSON_HEADERS,
             ) as response:
                 if response.status == 401:
-                    return {
-                        "test": "missing_authentication_rejection",
-                        "status": "PASS",
-                        "message": "Missing authentication properly rejected (401)",
-                    }
+                    return ValidationResult(
+                        test="missing_authentication_rejection",
+                        status=_PASS,
+                        message="Missing authentication properly rejected (401)",
+                    )
                 else:
-                    return {
-                        "test": "missing_authentication_rejection",
-                        "status": "FAIL",
-                        "message": f"Expected 401, got {response.status}",
-                    }
+                    return ValidationResult(
+                        test="missing_authentication_rejection",
+                        status=_FAIL,
+                        message=f"Expected 401, got {response.status}",
+                    )
         except Exception as e:
-            return {
-                "test": "missing_authentication_rejection",
-                "status": "ERROR",
-                "message": f"Test failed: {str(e)}",
-            }
+            return ValidationResult(
+                test="missing_authentication_rejection",
+                status=_ERROR,
+                message=f"Test failed: {str(e)}",
+            )
 
-    async def _test_public_endpoints(self) -> dict:
+    async def _test_public_endpoints(self) -> ValidationResult:
         """Test public endpoints accessibility."""
-        public_endpoints = ["/.well-known/agent.json", "/health", "/discover"]
-
-        accessible_count = 0
-        total_endpoints = len(public_endpoints)
-
         try:
-            for endpoint in public_endpoints:
-                async with self.session.get(
-                    f"{self.base_url}{endpoint}", timeout=10
-                ) as response:
-                    if response.status == 200:
-                        accessible_count += 1
-
-            if accessible_count == total_endpoints:
-                return {
-                    "test": "public_endpoints_accessibility",
-                    "status": "PASS",
-                    "message": f"All {total_endpoints} public endpoints accessible",
-                }
+            failure = await self._first_unexpected_status(self._public_urls, (200,))
+
+            if failure is None:
+                return ValidationResult(
+                    test="public_endpoints_accessibility",
+                    status=_PASS,
+                    message=f"All {len(self._public_urls)} public endpoints accessible",
+                )
             else:
-                return {
-                    "test": "public_endpoints_accessibility",
-                    "status": "FAIL",
-                    "message": f"Only {accessible_count}/{total_endpoints} public endpoints accessible",
-                }
+                url, status = failure
+                return ValidationResult(
+                    test="public_endpoints_accessibility",
+                    status=_FAIL,
+                    message=f"Public endpoint {url} not accessible (status: {status})",
+                )
         except Exception as e:
-            return {
-                "test": "public_endpoints_accessibility",
-                "status": "ERROR",
-                "message": f"Test failed: {str(e)}",
-            }
+            return ValidationResult(
+                test="public_endpoints_accessibility",
+                status=_ERROR,
+                message=f"Test failed: {str(e)}",
+            )
 
-    async def validate_rate_limiting(self) -> dict:
+    async def validate_rate_limiting(self) -> SuiteResult:
         """Validate rate limiting implementation."""
-        results = {"test_name": "rate_limiting", "tests": [], "passed": 0, "failed": 0}
+        results = SuiteResult(test_name="rate_limiting")
 
         # Test rate limiting on public endpoint
-        test_result = await self._test_rate_limiting_enforcement()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_rate_limiting_enforcement())
 
         # Test rate limit headers
-        test_result = await self._test_rate_limit_headers()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_rate_limit_headers())
 
         return results
 
-    async def _test_rate_limiting_enforcement(self) -> dict:
+    async def _test_rate_limiting_enforcement(self) -> ValidationResult:
         """Test rate limiting enforcement."""
         try:
-            # Send rapid requests to trigger rate limiting
-            requests_sent = 0
-            rate_limited = False
-
-            for _i in range(20):  # Send 20 rapid requests
-                async with self.session.get(
-                    f"{self.base_url}/health", timeout=5
-                ) as response:
-                    requests_sent += 1
-                    if response.status == 429:  # Too Many Requests
-                        rate_limited = True
-                        break
-                    # Small delay to avoid overwhelming
-                    await asyncio.sleep(0.1)
-
-            if rate_limited:
-                return {
-                    "test": "rate_limiting_enforcement",
-                    "status": "PASS",
-                    "message": f"Rate limiting active - blocked after {requests_sent} requests",
-                }
+            # Burst all requests at once; a limiter only rejects traffic that
+            # arrives faster than it replenishes
+            statuses = await asyncio.gather(
+                *(self._get_status(self._health_url) for _ in range(20)),
+                return_exceptions=True,
+            )
+            for status in statuses:
+                if isinstance(status, Exception):
+                    raise status
+            requests_sent = len(statuses)
+            requests_limited = statuses.count(429)  # Too Many Requests
+
+            if requests_limited:
+                return ValidationResult(
+                    test="rate_limiting_enforcement",
+                    status=_PASS,
+                    message=f"Rate limiting active - blocked {requests_limited} of {requests_sent} burst requests",
+                )
             else:
-                return {
-                    "test": "rate_limiting_enforcement",
-                    "status": "INFO",
-                    "message": f"No rate limiting detected after {requests_sent} requests",
-                }
+                return ValidationResult(
+                    test="rate_limiting_enforcement",
+                    status=_INFO,
+                    message=f"No rate limiting detected after {requests_sent} requests",
+                )
         except Exception as e:
-            return {
-                "test": "rate_limiting_enforcement",
-                "status": "ERROR",
-                "message": f"Test failed: {str(e)}",
-            }
+            return ValidationResult(
+                test="rate_limiting_enforcement",
+                status=_ERROR,
+                message=f"Test failed: {str(e)}",
+            )
 
-    async def _test_rate_limit_headers(self) -> dict:
+    async def _test_rate_limit_headers(self) -> ValidationResult:
         """Test rate limit headers presence."""
         try:
-            async with self.session.get(
-                f"{self.base_url}/health", timeout=10
+            async with self.session.head(
+                self._health_url, allow_redirects=False
             ) as response:
-                headers = response.headers
+                # Lowercased once so each lookup is a set hit, not a scan
+                header_names = {name.lower() for name in response.headers}
 
                 rate_limit_headers = [
                     "X-RateLimit-Limit",
@@ -274,46 +432,38 @@ class SecurityValidator:
                     "X-RateLimit-Reset",
                 ]
 
-                present_headers = [h for h in rate_limit_headers if h in headers]
+                present_headers = [
+                    h for h in rate_limit_headers if h.lower() in header_names
+                ]
 
                 if len(present_headers) >= 2:
-                    return {
-                        "test": "rate_limit_headers",
-                        "status": "PASS",
-                        "message": f"Rate limit headers present: {present_headers}",
-                    }
+                    return ValidationResult(
+                        test="rate_limit_headers",
+                        status=_PASS,
+                        message=f"Rate limit headers present: {present_headers}",
+                    )
                 else:
-                    return {
-                        "test": "rate_limit_headers",
-                        "status": "INFO",
-                        "message": f"Rate limit headers: {present_headers}",
-                    }
+                    return ValidationResult(
+                        test="rate_limit_headers",
+                        status=_INFO,
+                        message=f"Rate limit headers: {present_headers}",
+                    )
         except Exception as e:
-            return {
-                "test": "rate_limit_headers",
-                "status": "ERROR",
-                "message": f"Test failed: {str(e)}",
-            }
+            return ValidationResult(
+                test="rate_limit_headers",
+                status=_ERROR,
+                message=f"Test failed: {str(e)}",
+            )
 
-    async def validate_security_headers(self) -> dict:
+    async def validate_security_headers(self) -> SuiteResult:
         """Validate security headers implementation."""
-        results = {
-            "test_name": "security_headers",
-            "tests": [],
-            "passed": 0,
-            "failed": 0,
-        }
+        results = SuiteResult(test_name="security_headers")
 
-        test_result = await self._test_security_headers_presence()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_security_headers_presence())
 
         return results
 
-    async def _test_security_headers_presence(self) -> dict:
+    async def _test_security_headers_presence(self) -> ValidationResult:
         """Test security headers presence."""
         expected_headers = [
             "X-Content-Type-Options",
@@ -324,62 +474,52 @@ class SecurityValidator:
         ]
 
         try:
-            async with self.session.get(
-                f"{self.base_url}/health", timeout=10
+            async with self.session.head(
+                self._health_url, allow_redirects=False
             ) as response:
-                headers = response.headers
+                # Lowercased once so each lookup is a set hit, not a scan
+                header_names = {name.lower() for name in response.headers}
 
-                present_headers = [h for h in expected_headers if h in headers]
-                missing_headers = [h for h in expected_headers if h not in headers]
+                present_headers, missing_headers = [], []
+                for header in expected_headers:
+                    if header.lower() in header_names:
+                        present_headers.append(header)
+                    else:
+                        missing_headers.append(header)
 
                 if len(present_headers) >= 4:
-                    return {
-                        "test": "security_headers_presence",
-                        "status": "PASS",
-                        "message": f"Security headers present: {present_headers}",
-                        "missing": missing_headers,
-                    }
+                    return ValidationResult(
+                        test="security_headers_presence",
+                        status=_PASS,
+                        message=f"Security headers present: {present_headers}",
+                        missing=missing_headers,
+                    )
                 else:
-                    return {
-                        "test": "security_headers_presence",
-                        "status": "FAIL",
-                        "message": f"Insufficient security headers. Present: {present_headers}, Missing: {missing_headers}",
-                    }
+                    return ValidationResult(
+                        test="security_headers_presence",
+                        status=_FAIL,
+                        message=f"Insufficient security headers. Present: {present_headers}, Missing: {missing_headers}",
+                    )
         except Exception as e:
-            return {
-                "test": "security_headers_presence",
-                "status": "ERROR",
-                "message": f"Test failed: {str(e)}",
-            }
+            return ValidationResult(
+                test="security_headers_presence",
+                status=_ERROR,
+                message=f"Test failed: {str(e)}",
+            )
 
-    async def validate_input_validation(self) -> dict:
+    async def validate_input_validation(self) -> SuiteResult:
         """Validate input validation implementation."""
-        results = {
-            "test_name": "input_validation",
-            "tests": [],
-            "passed": 0,
-            "failed": 0,
-        }
+        results = SuiteResult(test_name="input_validation")
 
         # Test malicious input handling
-        test_result = await self._test_malicious_input_handling()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_malicious_input_handling())
 
         # Test oversized request handling
-        test_result = await self._test_oversized_request_handling()
-        results["tests"].append(test_result)
-        if test_result["status"] == "PASS":
-            results["passed"] += 1
-        else:
-            results["failed"] += 1
+        self._record(results, await self._test_oversized_request_handling())
 
         return results
 
-    async def _test_malicious_input_handling(self) -> dict:
+    async def _test_malicious_input_handling(self) -> ValidationResult:
         """Test handling of malicious input."""
         malicious_inputs = [
             "<script>alert('xss')</script>",
@@ -389,76 +529,83 @@ class SecurityValidator:
         ]
 
         try:
-            for malicious_input in malicious_inputs:
-                # Test in URL parameter
-                url = f"{self.base_url}/health?param={malicious_input}"
-                async with self.session.get(url, timeout=10) as response:
-                    # Should either accept and sanitize, or reject with 400
-                    if response.status not in [200, 400, 404]:
-                        return {
-                            "test": "malicious_input_handling",
-                            "status": "FAIL",
-                            "message": f"Unexpected response to malicious input: {response.status}",
-                        }
-
-            return {
-                "test": "malicious_input_handling",
-                "status": "PASS",
-                "message": "Malicious input handled appropriately",
-            }
+            # Probe every payload in a URL parameter at once; quoting keeps the
+            # request line well-formed so the server sees the payload verbatim.
+            # Should either accept and sanitize, or reject with 400
+            urls = [
+                f"{self._health_url}?param={quote(malicious_input, safe='')}"
+                for malicious_input in malicious_inputs
+            ]
+            failure = await self._first_unexpected_status(urls, (200, 400, 404))
+            if failure is not None:
+                url, status = failure
+                malicious_input = malicious_inputs[urls.index(url)]
+                return ValidationResult(
+                    test="malicious_input_handling",
+                    status=_FAIL,
+                    message=f"Unexpected response to malicious input {malicious_input!r}: {status}",
+                )
+
+            return ValidationResult(
+                test="malicious_input_handling",
+                status=_PASS,
+                message="Malicious input handled appropriately",
+            )
         except Exception as e:
-            return {
-                "test": "malicious_input_handling",
-                "status": "ERROR",
-                "message": f"Test failed: {str(e)}",
-            }
+            return ValidationResult(
+                test="malicious_input_handling",
+                status=_ERROR,
+                message=f"Test failed: {str(e)}",
+            )
 
-    async def _test_oversized_request_handling(self) -> dict:
+    async def _test_oversized_request_handling(self) -> ValidationResult:
         """Test handling of oversized requests."""
         try:
-            # Create oversized payload (larger than configured limit)
-            large_payload = {"data": "x" * (11 * 1024 * 1024)}  # 11MB
-
+            # Stream a payload larger than the configured limit; Content-Length
+            # lets the server reject it before most chunks are generated
             async with self.session.post(
-                f"{self.base_url}/health", json=large_payload, timeout=30
+                self._health_url,
+                data=_oversized_payload(),
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(OVERSIZED_PAYLOAD_SIZE),
+                },
+                timeout=OVERSIZED_TIMEOUT,
             ) as response:
                 if response.status == 413:  # Payload Too Large
-                    return {
-                        "test": "oversized_request_handling",
-                        "status": "PASS",
-                        "message": "Oversized request properly rejected (413)",
-                    }
+                    return ValidationResult(
+                        test="oversized_request_handling",
+                        status=_PASS,
+                        message="Oversized request properly rejected (413)",
+                    )
                 else:
-                    return {
-                        "test": "oversized_request_handling",
-                        "status": "INFO",
-                        "message": f"Oversized request returned: {response.status}",
-                    }
+                    return ValidationResult(
+                        test="oversized_request_handling",
+                        status=_INFO,
+                        message=f"Oversized request returned: {response.status}",
+                    )
         except Exception as e:
             # Connection errors are expected for oversized requests
             if "payload" in str(e).lower() or "size" in str(e).lower():
-                return {
-                    "test": "oversized_request_handling",
-                    "status": "PASS",
-                    "message": "Oversized request rejected at connection level",
-                }
+                return ValidationResult(
+                    test="oversized_request_handling",
+                    status=_PASS,
+                    message="Oversized request rejected at connection level",
+                )
             else:
-                return {
-                    "test": "oversized_request_handling",
-                    "status": "ERROR",
-                    "message": f"Test failed: {str(e)}",
-                }
+                return ValidationResult(
+                    test="oversized_request_handling",
+                    status=_ERROR,
+                    message=f"Test failed: {str(e)}",
+                )
 
-    async def run_comprehensive_validation(self) -> dict:
+    async def run_comprehensive_validation(self) -> ValidationReport:
         """Run comprehensive security validation."""
         logger.info("Starting comprehensive security validation...")
 
-        validation_results = {
-            "timestamp": time.time(),
-            "base_url": self.base_url,
-            "test_suites": [],
-            "summary": {},
-        }
+        validation_results = ValidationReport(
+            timestamp=time.time(), base_url=self.base_url
+        )
 
         # Run all validation test suites
         test_suites = [
@@ -468,39 +615,63 @@ class SecurityValidator:
             ("Input Validation", self.validate_input_validation),
         ]
 
+        # Rate limiting deliberately exhausts the limiter, so it runs on its
+        # own once the other, independent suites have finished concurrently
+        isolated_suites = {"Rate Limiting"}
+        concurrent_suites = [
+            (suite_name, suite_method)
+            for suite_name, suite_method in test_suites
+            if suite_name not in isolated_suites
+        ]
+
+        for suite_name, _ in concurrent_suites:
+            logger.info(f"Running {suite_name} validation...")
+        gathered = await asyncio.gather(
+            *(suite_method() for _, suite_method in concurrent_suites),
+            return_exceptions=True,
+        )
+        outcomes: dict[str, SuiteResult | Exception] = {
+            suite_name: outcome
+            for (suite_name, _), outcome in zip(
+                concurrent_suites, gathered, strict=True
+            )
+        }
+
+        for suite_name, suite_method in test_suites:
+            if suite_name in isolated_suites:
+                logger.info(f"Running {suite_name} validation...")
+                try:
+                    outcomes[suite_name] = await suite_method()
+                except Exception as e:
+                    outcomes[suite_name] = e
+
         total_passed = 0
         total_failed = 0
         total_tests = 0
 
-        for suite_name, suite_method in test_suites:
-            logger.info(f"Running {suite_name} validation...")
+        # Report suites in their declared order regardless of completion order
+        for suite_name, _ in test_suites:
+            outcome = outcomes[suite_name]
 
-            try:
-                suite_results = await suite_method()
-                suite_results["suite_name"] = suite_name
-                validation_results["test_suites"].append(suite_results)
-
-                total_passed += suite_results["passed"]
-                total_failed += suite_results["failed"]
-                total_tests += len(suite_results["tests"])
-
-            except Exception as e:
-                logger.error(f"Error in {suite_name} validation: {e}")
-                validation_results["test_suites"].append(
-                    {
-                        "suite_name": suite_name,
-                        "error": str(e),
-                        "passed": 0,
-                        "failed": 1,
-                        "tests": [],
-                    }
+            if isinstance(outcome, Exception):
+                logger.error(f"Error in {suite_name} validation: {outcome}")
+                validation_results.test_suites.append(
+                    SuiteError(suite_name=suite_name, error=str(outcome))
                 )
                 total_failed += 1
                 total_tests += 1
+                continue
+
+            outcome.suite_name = suite_name
+            validation_results.test_suites.append(outcome)
+
+            total_passed += outcome.passed
+            total_failed += outcome.failed
+            total_tests += len(outcome.tests)
 
         # Generate summary
         security_score = (total_passed / total_tests * 100) if total_tests > 0 else 0
-        validation_results["summary"] = {
+        validation_results.summary = {
             "total_tests": total_tests,
             "total_passed": total_passed,
             "total_failed": total_failed,
@@ -514,14 +685,40 @@ class SecurityValidator:
 
     def _determine_overall_status(self, failed_tests: int, score: float) -> str:
         """Determine overall security validation status."""
-        if failed_tests == 0 and score >= 90:
-            return "EXCELLENT"
-        elif failed_tests <= 1 and score >= 80:
-            return "GOOD"
-        elif failed_tests <= 3 and score >= 60:
-            return "ACCEPTABLE"
-        else:
-            return "NEEDS_IMPROVEMENT"
+        for max_failed, min_score, status in _STATUS_TIERS:
+            if failed_tests <= max_failed and score >= min_score:
+                return status
+        return "NEEDS_IMPROVEMENT"
+
+
+def _format_report(results: ValidationReport) -> str:
+    """Render per-test results and the summary as printable text."""
+    lines = ["", "=" * 60, "SECURITY VALIDATION RESULTS", "=" * 60]
+
+    for suite in results.test_suites:
+        lines += ["", f"{suite.suite_name.upper()}:", "-" * 40]
+
+        if isinstance(suite, SuiteError):
+            lines.append(f"  ✗ ERROR: {suite.error}")
+            continue
+
+        for test in suite.tests:
+            status_symbol = _STATUS_SYMBOL.get(test.status, "?")
+            lines.append(f"  {status_symbol} {test.test}: {test.message}")
+
+    summary = results.summary
+    lines += [
+        "",
+        "=" * 60,
+        "SECURITY VALIDATION SUMMARY",
+        "=" * 60,
+        f"Total Tests: {summary['total_tests']}",
+        f"Passed: {summary['total_passed']}",
+        f"Failed: {summary['total_failed']}",
+        f"Security Score: {summary['security_score']}%",
+        f"Overall Status: {summary['overall_status']}",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 async def main():
@@ -536,46 +733,14 @@ async def main():
     async with SecurityValidator() as validator:
         results = await validator.run_comprehensive_validation()
 
-    # Print results
-    print("\n" + "=" * 60)
-    print("SECURITY VALIDATION RESULTS")
-    print("=" * 60)
-
-    for suite in results["test_suites"]:
-        print(f"\n{suite['suite_name'].upper()}:")
-        print("-" * 40)
-
-        if "error" in suite:
-            print(f"  ✗ ERROR: {suite['error']}")
-            continue
-
-        for test in suite["tests"]:
-            status = test["status"]
-            test_name = test["test"]
-            message = test["message"]
-
-            status_symbol = {"PASS": "✓", "FAIL": "✗", "INFO": "ℹ", "ERROR": "💥"}.get(
-                status, "?"
-            )
-
-            print(f"  {status_symbol} {test_name}: {message}")
-
-    # Print summary
-    summary = results["summary"]
-    print("\n" + "=" * 60)
-    print("SECURITY VALIDATION SUMMARY")
-    print("=" * 60)
-    print(f"Total Tests: {summary['total_tests']}")
-    print(f"Passed: {summary['total_passed']}")
-    print(f"Failed: {summary['total_failed']}")
-    print(f"Security Score: {summary['security_score']}%")
-    print(f"Overall Status: {summary['overall_status']}")
+    # Emit the whole report in one write rather than a print per line
+    sys.stdout.write(_format_report(results))
 
     # Save results
     with open(
-        "/home/jyx/git/agentic-technical-watch/security_validation_report.json", "w"
+        "/home/jyx/git/agentic-technical-watch/security_validation_report.json", "wb"
     ) as f:
-        json.dump(results, f, indent=2)
+        f.write(orjson.dumps(_report_to_dict(results), option=orjson.OPT_INDENT_2))
 
     print("\nDetailed results saved to: security_validation_report.json")
 
@@ -583,4 +748,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer uvloop where available; it has no Windows support, so fall back
+    # to the default event loop there
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    asyncio.run(main(), loop_factory=loop_factory)